@@ -5,7 +5,7 @@ These functions are used throughout the engine for value manipulation,
 interpolation, and smoothing operations.
 """
 
-from typing import Union
+from typing import Callable, Union
 
 Number = Union[int, float]
 
@@ -72,7 +72,7 @@ def inverse_lerp(a: Number, b: Number, value: Number) -> float:
         >>> inverse_lerp(0.0, 10.0, 2.5)
         0.25
     """
-    if b - a == 0:
+    if a == b:
         return 0.0
     return (value - a) / (b - a)
 
@@ -100,10 +100,45 @@ def smoothstep(edge0: Number, edge1: Number, x: Number) -> float:
         >>> smoothstep(0.0, 1.0, 1.0)
         1.0
     """
-    t = clamp((x - edge0) / (edge1 - edge0) if edge1 != edge0 else 0.0, 0.0, 1.0)
+    if edge0 == edge1:
+        return 0.0
+    t = clamp((x - edge0) / (edge1 - edge0), 0.0, 1.0)
     return t * t * (3.0 - 2.0 * t)
 
 
+def make_smoothstep(edge0: Number, edge1: Number) -> Callable[[Number], float]:
+    """
+    Build a smoothstep function specialized for fixed edges.
+    
+    The reciprocal of the edge span is computed once, so each call
+    multiplies instead of divides. Use this where the same edges are
+    evaluated many times (fixed SDI bands, frequency boundaries).
+    
+    Args:
+        edge0: Lower edge of transition
+        edge1: Upper edge of transition
+        
+    Returns:
+        Function of x equivalent to smoothstep(edge0, edge1, x)
+        
+    Example:
+        >>> band = make_smoothstep(0.0, 2.0)
+        >>> band(1.0)
+        0.5
+    """
+    inv = 0.0 if edge1 == edge0 else 1.0 / (edge1 - edge0)
+    
+    def _smoothstep(x: Number) -> float:
+        t = (x - edge0) * inv
+        if t < 0.0:
+            t = 0.0
+        elif t > 1.0:
+            t = 1.0
+        return t * t * (3.0 - 2.0 * t)
+    
+    return _smoothstep
+
+
 def exp_smooth(current: float, target: float, factor: float) -> float:
     """
     Exponential smoothing for gradual value changes.
@@ -128,6 +163,44 @@ def exp_smooth(current: float, target: float, factor: float) -> float:
     return current + (target - current) * factor
 
 
+def sdi_update(current: float, target: float, factor: float,
+               edge0: float, edge1: float) -> float:
+    """
+    Smooth, clamp and shape an SDI value in a single call.
+    
+    Equivalent to ``smoothstep(edge0, edge1, clamp(exp_smooth(current,
+    target, factor), -1.0, 1.0))`` but evaluated inline, avoiding three
+    function calls on the per-tick path.
+    
+    Args:
+        current: Current SDI value
+        target: Target SDI value to move towards
+        factor: Smoothing factor (0.0-1.0, lower = slower smoothing)
+        edge0: Lower edge of the shaping transition
+        edge1: Upper edge of the shaping transition
+        
+    Returns:
+        Shaped value between 0 and 1
+        
+    Example:
+        >>> sdi_update(0.0, 1.0, 0.5, -1.0, 1.0)
+        0.84375
+    """
+    v = current + (target - current) * factor
+    if v < -1.0:
+        v = -1.0
+    elif v > 1.0:
+        v = 1.0
+    if edge0 == edge1:
+        return 0.0
+    t = (v - edge0) / (edge1 - edge0)
+    if t < 0.0:
+        t = 0.0
+    elif t > 1.0:
+        t = 1.0
+    return t * t * (3.0 - 2.0 * t)
+
+
 def remap(value: Number, in_min: Number, in_max: Number, 
           out_min: Number, out_max: Number) -> float:
     """
@@ -153,6 +226,36 @@ def remap(value: Number, in_min: Number, in_max: Number,
     return lerp(out_min, out_max, t)
 
 
+def make_remap(in_min: Number, in_max: Number,
+               out_min: Number, out_max: Number) -> Callable[[Number], float]:
+    """
+    Build a remap function specialized for fixed ranges.
+    
+    The scale factor between the ranges is computed once, turning each
+    call into a single multiply-add.
+    
+    Args:
+        in_min: Input range minimum
+        in_max: Input range maximum
+        out_min: Output range minimum
+        out_max: Output range maximum
+        
+    Returns:
+        Function of value equivalent to remap(value, in_min, in_max, out_min, out_max)
+        
+    Example:
+        >>> to_percent = make_remap(0.0, 1.0, 0.0, 100.0)
+        >>> to_percent(0.5)
+        50.0
+    """
+    scale = 0.0 if in_max == in_min else (out_max - out_min) / (in_max - in_min)
+    
+    def _remap(value: Number) -> float:
+        return out_min + (value - in_min) * scale
+    
+    return _remap
+
+
 def weighted_average(values: list, weights: list) -> float:
     """
     Calculate weighted average of values.
@@ -188,6 +291,10 @@ def variance(values: list) -> float:
     
     Used for pattern detection to measure rhythm consistency.
     
+    Computed in a single pass as E[X²] - E[X]². This can lose precision
+    when the mean is large relative to the spread; use variance_stable()
+    where that matters.
+    
     Args:
         values: List of numeric values
         
@@ -198,6 +305,37 @@ def variance(values: list) -> float:
         >>> variance([1, 2, 3, 4, 5])
         2.0
     """
+    n = len(values)
+    if n < 2:
+        return 0.0
+    
+    total = 0.0
+    total_sq = 0.0
+    for x in values:
+        total += x
+        total_sq += x * x
+    mean = total / n
+    # Rounding can push the difference slightly below zero
+    return max(0.0, total_sq / n - mean * mean)
+
+
+def variance_stable(values: list) -> float:
+    """
+    Calculate variance of a list of values using the two-pass method.
+    
+    Slower than variance() but immune to catastrophic cancellation when
+    the values share a large common offset.
+    
+    Args:
+        values: List of numeric values
+        
+    Returns:
+        Variance of the values
+        
+    Example:
+        >>> variance_stable([1, 2, 3, 4, 5])
+        2.0
+    """
     if len(values) < 2:
         return 0.0
     
@@ -19,6 +19,9 @@ class SeededRNG:
     Wraps Python's random module with explicit seed management for
     reproducibility. Each instance maintains its own state.
     
+    Draw counting is off by default so the hot methods stay a single
+    delegation; call enable_counting() when debugging a stream.
+    
     Attributes:
         seed: The seed used to initialize this RNG
         name: Optional name for debugging
@@ -31,6 +34,8 @@ class SeededRNG:
         True
     """
     
+    __slots__ = ('name', 'seed', '_random', '_call_count')
+    
     def __init__(self, seed: Optional[int] = None, name: str = "default"):
         """
         Initialize the RNG with an optional seed.
@@ -56,7 +61,6 @@ class SeededRNG:
         Returns:
             Random float between 0.0 (inclusive) and 1.0 (exclusive)
         """
-        self._call_count += 1
         return self._random.random()
     
     def uniform(self, a: float, b: float) -> float:
@@ -70,7 +74,6 @@ class SeededRNG:
         Returns:
             Random float between a and b (inclusive)
         """
-        self._call_count += 1
         return self._random.uniform(a, b)
     
     def randint(self, a: int, b: int) -> int:
@@ -84,9 +87,23 @@ class SeededRNG:
         Returns:
             Random integer between a and b
         """
-        self._call_count += 1
         return self._random.randint(a, b)
     
+    def getrandbits(self, k: int) -> int:
+        """
+        Return a random integer with k random bits.
+        
+        Cheaper than randint(0, 2**k - 1) for full-range values such as
+        derived seeds, since it skips randint's rejection sampling.
+        
+        Args:
+            k: Number of bits
+            
+        Returns:
+            Random integer in [0, 2**k)
+        """
+        return self._random.getrandbits(k)
+    
     def probability(self, p: float) -> bool:
         """
         Return True with probability p.
@@ -124,7 +141,6 @@ class SeededRNG:
         Raises:
             IndexError: If sequence is empty
         """
-        self._call_count += 1
         return self._random.choice(sequence)
     
     def weighted_choice(self, items: List[T], weights: List[float]) -> T:
@@ -152,7 +168,6 @@ class SeededRNG:
         if not items:
             raise ValueError("Cannot choose from empty list")
         
-        self._call_count += 1
         total = sum(weights)
         if total == 0:
             return self._random.choice(items)
@@ -177,9 +192,11 @@ class SeededRNG:
         Returns:
             New list with items in random order
         """
-        self._call_count += 1
         result = items.copy()
-        self._random.shuffle(result)
+        # Lists of 0 or 1 items draw nothing, so skipping the shuffle
+        # keeps the stream identical.
+        if len(result) > 1:
+            self._random.shuffle(result)
         return result
     
     def gauss(self, mu: float, sigma: float) -> float:
@@ -195,9 +212,27 @@ class SeededRNG:
         Returns:
             Random value from the normal distribution
         """
-        self._call_count += 1
         return self._random.gauss(mu, sigma)
     
+    def gauss_batch(self, mu: float, sigma: float, n: int) -> List[float]:
+        """
+        Return n values from a Gaussian distribution.
+        
+        Produces the same sequence as n consecutive gauss() calls, but
+        binds the underlying generator once instead of paying a method
+        dispatch per sample.
+        
+        Args:
+            mu: Mean of the distribution
+            sigma: Standard deviation
+            n: Number of samples
+            
+        Returns:
+            List of n random values from the normal distribution
+        """
+        gauss = self._random.gauss
+        return [gauss(mu, sigma) for _ in range(n)]
+    
     def vary(self, value: float, variance_ratio: float) -> float:
         """
         Return a value with random variance applied.
@@ -215,10 +250,32 @@ class SeededRNG:
         Example:
             >>> rng = SeededRNG(42)
             >>> rng.vary(10.0, 0.1)  # 10.0 ± 10%
-            9.27...
+            10.27...
         """
+        # random.uniform(lo, hi) computes lo + (hi - lo) * random(); repeat
+        # that arithmetic here so results match uniform() bit for bit while
+        # skipping the uniform() wrapper call.
         variance = value * variance_ratio
-        return self.uniform(value - variance, value + variance)
+        lo = value - variance
+        return lo + ((value + variance) - lo) * self.random()
+    
+    def enable_counting(self) -> None:
+        """
+        Start counting draws in call_count (for debugging).
+        
+        Swaps this instance onto a counting variant of the class, so
+        instances that never enable counting pay nothing for it.
+        """
+        self.__class__ = _CountingSeededRNG
+    
+    def disable_counting(self) -> None:
+        """Stop counting draws. The current count is kept."""
+        self.__class__ = SeededRNG
+    
+    @property
+    def counting_enabled(self) -> bool:
+        """Whether draws are currently being counted."""
+        return isinstance(self, _CountingSeededRNG)
     
     def reset(self, seed: Optional[int] = None) -> None:
         """
@@ -262,6 +319,49 @@ class SeededRNG:
         return f"SeededRNG(seed={self.seed}, name='{self.name}', calls={self._call_count})"
 
 
+class _CountingSeededRNG(SeededRNG):
+    """SeededRNG variant that increments _call_count on every draw."""
+    
+    __slots__ = ()
+    
+    def random(self) -> float:
+        self._call_count += 1
+        return self._random.random()
+    
+    def uniform(self, a: float, b: float) -> float:
+        self._call_count += 1
+        return self._random.uniform(a, b)
+    
+    def randint(self, a: int, b: int) -> int:
+        self._call_count += 1
+        return self._random.randint(a, b)
+    
+    def getrandbits(self, k: int) -> int:
+        self._call_count += 1
+        return self._random.getrandbits(k)
+    
+    def choice(self, sequence: Sequence[T]) -> T:
+        self._call_count += 1
+        return self._random.choice(sequence)
+    
+    def weighted_choice(self, items: List[T], weights: List[float]) -> T:
+        result = super().weighted_choice(items, weights)
+        self._call_count += 1
+        return result
+    
+    def shuffle(self, items: List[T]) -> List[T]:
+        self._call_count += 1
+        return super().shuffle(items)
+    
+    def gauss(self, mu: float, sigma: float) -> float:
+        self._call_count += 1
+        return self._random.gauss(mu, sigma)
+    
+    def gauss_batch(self, mu: float, sigma: float, n: int) -> List[float]:
+        self._call_count += n
+        return super().gauss_batch(mu, sigma, n)
+
+
 class RNGManager:
     """
     Manages multiple named RNG streams.
@@ -278,6 +378,8 @@ class RNGManager:
         3.14...
     """
     
+    __slots__ = ('_master', '_streams', 'master_seed')
+    
     def __init__(self, master_seed: Optional[int] = None):
         """
         Initialize the RNG manager with a master seed.
@@ -293,17 +395,24 @@ class RNGManager:
         """
         Get or create a named RNG stream.
         
+        Existing streams are returned with a single dict lookup. Callers
+        on hot paths should hold on to the returned instance rather than
+        calling get() per decision.
+        
         Args:
             name: Name of the RNG stream
             
         Returns:
             SeededRNG instance for the named stream
         """
-        if name not in self._streams:
+        try:
+            return self._streams[name]
+        except KeyError:
             # Derive a seed from the master RNG
             derived_seed = self._master.randint(0, 2**32 - 1)
-            self._streams[name] = SeededRNG(seed=derived_seed, name=name)
-        return self._streams[name]
+            rng = SeededRNG(seed=derived_seed, name=name)
+            self._streams[name] = rng
+            return rng
     
     def reset_all(self) -> None:
         """Reset all RNG streams to their initial states."""
@@ -5,16 +5,18 @@ Provides validation functions for configuration data, runtime inputs,
 and state consistency checks.
 """
 
-from typing import Any, List, Optional, Set
+from typing import AbstractSet, Any, Dict, List, Optional, Sequence, Set
 
 
 class ValidationError(Exception):
     """Raised when validation fails."""
     
+    __slots__ = ('message', 'field')
+    
     def __init__(self, message: str, field: Optional[str] = None):
         self.message = message
         self.field = field
-        super().__init__(f"{field}: {message}" if field else message)
+        Exception.__init__(self, f"{field}: {message}" if field else message)
 
 
 def validate_range(value: float, min_val: float, max_val: float, 
@@ -42,6 +44,35 @@ def validate_range(value: float, min_val: float, max_val: float,
     return value
 
 
+def validate_range_array(values: Sequence[float], min_val: float, max_val: float,
+                         field: str = "values") -> Sequence[float]:
+    """
+    Validate that every value in a sequence is within a range.
+    
+    Checks the whole batch in one loop instead of one validate_range()
+    call per element, and reports the first offending index.
+    
+    Args:
+        values: Values to validate
+        min_val: Minimum allowed value (inclusive)
+        max_val: Maximum allowed value (inclusive)
+        field: Field name for error messages
+        
+    Returns:
+        The validated values
+        
+    Raises:
+        ValidationError: If any value is outside range
+    """
+    for i, value in enumerate(values):
+        if not min_val <= value <= max_val:
+            raise ValidationError(
+                f"must be between {min_val} and {max_val}, got {value}",
+                f"{field}[{i}]"
+            )
+    return values
+
+
 def validate_probability(value: float, field: str = "probability") -> float:
     """
     Validate that a value is a valid probability (0.0 to 1.0).
@@ -56,7 +87,10 @@ def validate_probability(value: float, field: str = "probability") -> float:
     Raises:
         ValidationError: If value is not a valid probability
     """
-    return validate_range(value, 0.0, 1.0, field)
+    # Inlined rather than delegating to validate_range: called per event
+    if 0.0 <= value <= 1.0:
+        return value
+    raise ValidationError(f"must be between 0.0 and 1.0, got {value}", field)
 
 
 def validate_sdi(value: float, field: str = "sdi") -> float:
@@ -73,7 +107,10 @@ def validate_sdi(value: float, field: str = "sdi") -> float:
     Raises:
         ValidationError: If value is not a valid SDI
     """
-    return validate_range(value, -1.0, 1.0, field)
+    # Inlined rather than delegating to validate_range: called per event
+    if -1.0 <= value <= 1.0:
+        return value
+    raise ValidationError(f"must be between -1.0 and 1.0, got {value}", field)
 
 
 def validate_positive(value: float, field: str = "value", 
@@ -122,7 +159,18 @@ def validate_not_empty(value: Any, field: str = "value") -> Any:
     return value
 
 
-def validate_in_set(value: Any, valid_values: Set[Any], 
+def _format_valid_values(valid_values: AbstractSet[Any]) -> str:
+    """Format a set of valid values for an error message."""
+    return ', '.join(str(v) for v in sorted(valid_values, key=str))
+
+
+# Pre-formatted error strings for the module-level value sets, keyed by id().
+# Only the VALID_* constants are registered: they are frozensets that live for
+# the whole process, so the text can never go stale and ids are never reused.
+_SORTED_VALID_STRINGS: Dict[int, str] = {}
+
+
+def validate_in_set(value: Any, valid_values: AbstractSet[Any], 
                     field: str = "value") -> Any:
     """
     Validate that a value is in a set of valid values.
@@ -139,7 +187,9 @@ def validate_in_set(value: Any, valid_values: Set[Any],
         ValidationError: If value is not in valid_values
     """
     if value not in valid_values:
-        valid_str = ', '.join(str(v) for v in sorted(valid_values, key=str))
+        valid_str = _SORTED_VALID_STRINGS.get(id(valid_values))
+        if valid_str is None:
+            valid_str = _format_valid_values(valid_values)
         raise ValidationError(
             f"must be one of [{valid_str}], got '{value}'",
             field
@@ -245,13 +295,18 @@ def validate_type(value: Any, expected_type: type,
     return value
 
 
-# Valid enum values for quick validation
-VALID_LAYERS = {'background', 'periodic', 'reactive', 'anomalous'}
-VALID_FREQUENCY_BANDS = {'low', 'low_mid', 'mid', 'mid_high', 'high', 'full'}
-VALID_TIME_OF_DAY = {'dawn', 'day', 'dusk', 'night', 'midnight', 'all'}
-VALID_WEATHER = {'clear', 'cloudy', 'rain', 'storm', 'fog', 'wind'}
-VALID_END_TYPES = {'natural', 'fade_out', 'interrupted', 'forced'}
-VALID_DELTA_CATEGORIES = {'none', 'small', 'medium', 'large', 'critical'}
+# Valid enum values for quick validation (immutable; see _SORTED_VALID_STRINGS)
+VALID_LAYERS = frozenset({'background', 'periodic', 'reactive', 'anomalous'})
+VALID_FREQUENCY_BANDS = frozenset({'low', 'low_mid', 'mid', 'mid_high', 'high', 'full'})
+VALID_TIME_OF_DAY = frozenset({'dawn', 'day', 'dusk', 'night', 'midnight', 'all'})
+VALID_WEATHER = frozenset({'clear', 'cloudy', 'rain', 'storm', 'fog', 'wind'})
+VALID_END_TYPES = frozenset({'natural', 'fade_out', 'interrupted', 'forced'})
+VALID_DELTA_CATEGORIES = frozenset({'none', 'small', 'medium', 'large', 'critical'})
+
+for _valid_set in (VALID_LAYERS, VALID_FREQUENCY_BANDS, VALID_TIME_OF_DAY,
+                   VALID_WEATHER, VALID_END_TYPES, VALID_DELTA_CATEGORIES):
+    _SORTED_VALID_STRINGS[id(_valid_set)] = _format_valid_values(_valid_set)
+del _valid_set
 
 
 def validate_layer(layer: str, field: str = "layer") -> str:
@@ -51,136 +51,142 @@ Phase 8: Pressure Coordinator
 - Holistic state management
 """
 
-# Phase 1: Core
-from .vdi_calculator import (
-    VDICalculator,
-    VDIResult,
-    VDIFactors,
-    VDEConfig,
-    VisualPhase,
-    WildlifeState,
-)
+import importlib
+from typing import Any, Dict, List, Tuple
 
-from .output_params import (
-    OutputGenerator,
-    VDEOutputState,
-    PostProcessParams,
-    MaterialParams,
-    SpawnParams,
-    ParticleParams,
-    MotionParams,
-    AttractionParams,
-)
-
-# Phase 2: UE5 Integration
-from .ue5_binding import (
-    UE5BindingGenerator,
-    FVDERegionState,
-    FVDEPostProcessSettings,
-    FVDEMaterialParameters,
-    FVDENiagaraParameters,
-    FVDESpawnSettings,
-    FVDEAttractionSettings,
-    FVDEWorldState,
-    MultiRegionProcessor,
-)
-
-# Phase 3: Wildlife System
-from .wildlife import (
-    WildlifeManager,
-    WildlifeConfig,
-    WildlifeSnapshot,
-    WildlifeState as WildlifeStateEnum,  # Alias to avoid conflict
-    CreatureTier,
-    CreatureCategory,
-    CreatureState,
-    WildlifeSpawnGenerator,
-    FWildlifeSpawnCommand,
-    CREATURE_TIERS,
-)
-
-# Phase 4: NPC Modulation
-from .npc_behavior import (
-    NPCManager,
-    NPCConfig,
-    NPCSnapshot,
-    NPCState,
-    NPCType,
-    ComfortLevel,
-    IdleBehavior,
-    RepositionReason,
-    NPCBehaviorProfile,
-    NPCCommandGenerator,
-    FNPCBehaviorCommand,
-    DEFAULT_PROFILES,
-)
+# Public names are resolved lazily (PEP 562): each maps to the submodule
+# and attribute it comes from, and the submodule is only imported the
+# first time one of its names is accessed.
+_LAZY_IMPORTS: Dict[str, Tuple[str, str]] = {
+    # Phase 1: Core
+    'VDICalculator': ('vdi_calculator', 'VDICalculator'),
+    'VDIResult': ('vdi_calculator', 'VDIResult'),
+    'VDIFactors': ('vdi_calculator', 'VDIFactors'),
+    'VDEConfig': ('vdi_calculator', 'VDEConfig'),
+    'VisualPhase': ('vdi_calculator', 'VisualPhase'),
+    'WildlifeState': ('vdi_calculator', 'WildlifeState'),
+    
+    'OutputGenerator': ('output_params', 'OutputGenerator'),
+    'VDEOutputState': ('output_params', 'VDEOutputState'),
+    'PostProcessParams': ('output_params', 'PostProcessParams'),
+    'MaterialParams': ('output_params', 'MaterialParams'),
+    'SpawnParams': ('output_params', 'SpawnParams'),
+    'ParticleParams': ('output_params', 'ParticleParams'),
+    'MotionParams': ('output_params', 'MotionParams'),
+    'AttractionParams': ('output_params', 'AttractionParams'),
+    
+    # Phase 2: UE5 Integration
+    'UE5BindingGenerator': ('ue5_binding', 'UE5BindingGenerator'),
+    'FVDERegionState': ('ue5_binding', 'FVDERegionState'),
+    'FVDEPostProcessSettings': ('ue5_binding', 'FVDEPostProcessSettings'),
+    'FVDEMaterialParameters': ('ue5_binding', 'FVDEMaterialParameters'),
+    'FVDENiagaraParameters': ('ue5_binding', 'FVDENiagaraParameters'),
+    'FVDESpawnSettings': ('ue5_binding', 'FVDESpawnSettings'),
+    'FVDEAttractionSettings': ('ue5_binding', 'FVDEAttractionSettings'),
+    'FVDEWorldState': ('ue5_binding', 'FVDEWorldState'),
+    'MultiRegionProcessor': ('ue5_binding', 'MultiRegionProcessor'),
+    
+    # Phase 3: Wildlife System
+    'WildlifeManager': ('wildlife', 'WildlifeManager'),
+    'WildlifeConfig': ('wildlife', 'WildlifeConfig'),
+    'WildlifeSnapshot': ('wildlife', 'WildlifeSnapshot'),
+    'WildlifeStateEnum': ('wildlife', 'WildlifeState'),  # Alias to avoid conflict
+    'CreatureTier': ('wildlife', 'CreatureTier'),
+    'CreatureCategory': ('wildlife', 'CreatureCategory'),
+    'CreatureState': ('wildlife', 'CreatureState'),
+    'WildlifeSpawnGenerator': ('wildlife', 'WildlifeSpawnGenerator'),
+    'FWildlifeSpawnCommand': ('wildlife', 'FWildlifeSpawnCommand'),
+    'CREATURE_TIERS': ('wildlife', 'CREATURE_TIERS'),
+    
+    # Phase 4: NPC Modulation
+    'NPCManager': ('npc_behavior', 'NPCManager'),
+    'NPCConfig': ('npc_behavior', 'NPCConfig'),
+    'NPCSnapshot': ('npc_behavior', 'NPCSnapshot'),
+    'NPCState': ('npc_behavior', 'NPCState'),
+    'NPCType': ('npc_behavior', 'NPCType'),
+    'ComfortLevel': ('npc_behavior', 'ComfortLevel'),
+    'IdleBehavior': ('npc_behavior', 'IdleBehavior'),
+    'RepositionReason': ('npc_behavior', 'RepositionReason'),
+    'NPCBehaviorProfile': ('npc_behavior', 'NPCBehaviorProfile'),
+    'NPCCommandGenerator': ('npc_behavior', 'NPCCommandGenerator'),
+    'FNPCBehaviorCommand': ('npc_behavior', 'FNPCBehaviorCommand'),
+    'DEFAULT_PROFILES': ('npc_behavior', 'DEFAULT_PROFILES'),
+    
+    # Phase 5: Environmental Wear
+    'WearManager': ('environmental_wear', 'WearManager'),
+    'WearConfig': ('environmental_wear', 'WearConfig'),
+    'WearSnapshot': ('environmental_wear', 'WearSnapshot'),
+    'WearLayer': ('environmental_wear', 'WearLayer'),
+    'SurfaceType': ('environmental_wear', 'SurfaceType'),
+    'WearType': ('environmental_wear', 'WearType'),
+    'FWearParameters': ('environmental_wear', 'FWearParameters'),
+    'RegionWearManager': ('environmental_wear', 'RegionWearManager'),
+    'WearZone': ('environmental_wear', 'WearZone'),
+    'WEAR_LAYER_MAP': ('environmental_wear', 'WEAR_LAYER_MAP'),
+    'SURFACE_WEAR_MAP': ('environmental_wear', 'SURFACE_WEAR_MAP'),
+    
+    # Phase 6: Motion Coherence
+    'MotionManager': ('motion_coherence', 'MotionManager'),
+    'MotionConfig': ('motion_coherence', 'MotionConfig'),
+    'MotionSnapshot': ('motion_coherence', 'MotionSnapshot'),
+    'MotionCategory': ('motion_coherence', 'MotionCategory'),
+    'CoherenceLevel': ('motion_coherence', 'CoherenceLevel'),
+    'WindPattern': ('motion_coherence', 'WindPattern'),
+    'ElementMotionState': ('motion_coherence', 'ElementMotionState'),
+    'CategoryState': ('motion_coherence', 'CategoryState'),
+    'FMotionParameters': ('motion_coherence', 'FMotionParameters'),
+    'WindPatternGenerator': ('motion_coherence', 'WindPatternGenerator'),
+    
+    # Phase 7: Attraction System
+    'AttractionManager': ('attraction_system', 'AttractionManager'),
+    'AttractionConfig': ('attraction_system', 'AttractionConfig'),
+    'AttractionSnapshot': ('attraction_system', 'AttractionSnapshot'),
+    'AttractionSignal': ('attraction_system', 'AttractionSignal'),
+    'AttractionStrength': ('attraction_system', 'AttractionStrength'),
+    'DistantCue': ('attraction_system', 'DistantCue'),
+    'RegionAttractionState': ('attraction_system', 'RegionAttractionState'),
+    'AttractionCoordinator': ('attraction_system', 'AttractionCoordinator'),
+    'FAttractionParameters': ('attraction_system', 'FAttractionParameters'),
+    'DistantCueGenerator': ('attraction_system', 'DistantCueGenerator'),
+    'DistantCueCommand': ('attraction_system', 'DistantCueCommand'),
+    
+    # Phase 8: Pressure Coordinator
+    'PressureCoordinator': ('pressure_coordinator', 'PressureCoordinator'),
+    'PressureConfig': ('pressure_coordinator', 'PressureConfig'),
+    'PressureSnapshot': ('pressure_coordinator', 'PressureSnapshot'),
+    'PressurePhase': ('pressure_coordinator', 'PressurePhase'),
+    'SyncState': ('pressure_coordinator', 'SyncState'),
+    'RegionPressureManager': ('pressure_coordinator', 'RegionPressureManager'),
+    'RegionPressureState': ('pressure_coordinator', 'RegionPressureState'),
+    'PressureHistory': ('pressure_coordinator', 'PressureHistory'),
+    'PressureSample': ('pressure_coordinator', 'PressureSample'),
+    'FPressureParameters': ('pressure_coordinator', 'FPressureParameters'),
+    'ScenarioSimulator': ('pressure_coordinator', 'ScenarioSimulator'),
+    
+    # Legacy compatibility
+    'VDEEngine': ('vde_engine', 'VDEEngine'),
+    'VDEState': ('vde_engine', 'VDEState'),
+    'VDECalculator': ('vde_engine', 'VDECalculator'),
+    'VisualThresholds': ('vde_engine', 'VisualThresholds'),
+}
 
-# Phase 5: Environmental Wear
-from .environmental_wear import (
-    WearManager,
-    WearConfig,
-    WearSnapshot,
-    WearLayer,
-    SurfaceType,
-    WearType,
-    FWearParameters,
-    RegionWearManager,
-    WearZone,
-    WEAR_LAYER_MAP,
-    SURFACE_WEAR_MAP,
-)
 
-# Phase 6: Motion Coherence
-from .motion_coherence import (
-    MotionManager,
-    MotionConfig,
-    MotionSnapshot,
-    MotionCategory,
-    CoherenceLevel,
-    WindPattern,
-    ElementMotionState,
-    CategoryState,
-    FMotionParameters,
-    WindPatternGenerator,
-)
+def __getattr__(name: str) -> Any:
+    """Import the submodule providing ``name`` on first access."""
+    try:
+        module_name, attr = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    
+    module = importlib.import_module(f".{module_name}", __name__)
+    value = getattr(module, attr)
+    globals()[name] = value  # Cache so later lookups skip __getattr__
+    return value
 
-# Phase 7: Attraction System
-from .attraction_system import (
-    AttractionManager,
-    AttractionConfig,
-    AttractionSnapshot,
-    AttractionSignal,
-    AttractionStrength,
-    DistantCue,
-    RegionAttractionState,
-    AttractionCoordinator,
-    FAttractionParameters,
-    DistantCueGenerator,
-    DistantCueCommand,
-)
 
-# Phase 8: Pressure Coordinator
-from .pressure_coordinator import (
-    PressureCoordinator,
-    PressureConfig,
-    PressureSnapshot,
-    PressurePhase,
-    SyncState,
-    RegionPressureManager,
-    RegionPressureState,
-    PressureHistory,
-    PressureSample,
-    FPressureParameters,
-    ScenarioSimulator,
-)
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
 
-# Legacy compatibility
-from .vde_engine import (
-    VDEEngine,
-    VDEState,
-    VDECalculator,
-    VisualThresholds,
-)
 
 __all__ = [
     # Phase 1: Core
@@ -0,0 +1,29 @@
+"""
+Helpers shared by the VDE subsystem modules.
+
+Kept free of imports from sibling modules so any phase module can use it
+without creating an import cycle.
+"""
+
+from typing import Any, Dict, Optional
+import json
+import sys
+
+
+# Keyword arguments for @dataclass on hot-path value types. On Python 3.10+
+# the classes get __slots__ (no per-instance __dict__, faster attribute
+# access); on 3.8/3.9 they stay regular dataclasses. Either way the public
+# fields are identical -- only ad-hoc attributes outside the declared
+# fields differ, and no VDE code relies on them.
+DATACLASS_SLOTS: Dict[str, bool] = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+def ue5_json_string(payload: Any, indent: Optional[int] = None) -> str:
+    """
+    Serialize a UE5 payload to a JSON string.
+
+    Every to_json_string() in the VDE goes through here so all payloads
+    share one format: json.dumps defaults (', ' and ': ' separators),
+    pretty-printed when indent is given.
+    """
+    return json.dumps(payload, indent=indent)
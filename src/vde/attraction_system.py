@@ -22,8 +22,12 @@ mechanic pushing them around.
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Any, Tuple, Set
 from enum import Enum
+from bisect import bisect_right
+from operator import attrgetter, itemgetter
 import math
 
+from ._common import DATACLASS_SLOTS, ue5_json_string
+
 
 # =============================================================================
 # Enums and Constants
@@ -57,13 +61,29 @@ class AttractionStrength(Enum):
     BEACON = "beacon"       # Maximum attraction
 
 
+# Cues below this intensity are tracked but not spawned
+_CUE_SPAWN_MIN_INTENSITY = 0.1
+
+# Serialized string for each enum member, avoiding Enum.value lookups
+_SIGNAL_KEYS: Dict[AttractionSignal, str] = {s: s.value for s in AttractionSignal}
+_CUE_KEYS: Dict[DistantCue, str] = {c: c.value for c in DistantCue}
+_STRENGTH_KEYS: Dict[AttractionStrength, str] = {s: s.value for s in AttractionStrength}
+
+
 # =============================================================================
 # Configuration
 # =============================================================================
 
 @dataclass
 class AttractionConfig:
-    """Configuration for attraction system."""
+    """
+    Configuration for attraction system.
+    
+    AttractionManager bakes the population thresholds, signal boosts and
+    distant cue thresholds into lookup tables when it is constructed; call
+    AttractionManager.set_config() (or AttractionCoordinator.set_config())
+    after changing any of them on a config that a manager is already using.
+    """
     
     # Population thresholds for attraction strength
     # Note: LOWER population = MORE attraction
@@ -152,6 +172,7 @@ class RegionAttractionState:
     
     # Attraction
     attraction_strength: AttractionStrength = AttractionStrength.NONE
+    strength_index: int = 0  # Position of attraction_strength in STRENGTH_ORDER
     attraction_value: float = 0.0  # 0-1, smoothed
     target_attraction: float = 0.0
     
@@ -162,6 +183,10 @@ class RegionAttractionState:
     active_cues: Set[DistantCue] = field(default_factory=set)
     cue_intensities: Dict[DistantCue, float] = field(default_factory=dict)
     
+    # Active cues strong enough to spawn, as (cue, intensity) pairs;
+    # maintained by AttractionManager alongside the two fields above
+    spawn_cues: Tuple[Tuple[DistantCue, float], ...] = ()
+    
     # Neighbor influence
     neighbor_pressure: float = 0.0  # Pressure from crowded neighbors
     is_receiving_overflow: bool = False
@@ -205,14 +230,28 @@ class AttractionSnapshot:
         return {
             'region_id': self.region_id,
             'population': self.population,
-            'attraction_strength': self.attraction_strength.value,
+            'attraction_strength': _STRENGTH_KEYS[self.attraction_strength],
             'attraction_value': self.attraction_value,
-            'signal_boosts': {k.value: v for k, v in self.signal_boosts.items()},
-            'active_cues': [c.value for c in self.active_cues],
-            'cue_intensities': {k.value: v for k, v in self.cue_intensities.items()},
+            'signal_boosts': {_SIGNAL_KEYS[k]: v for k, v in self.signal_boosts.items()},
+            'active_cues': [_CUE_KEYS[c] for c in self.active_cues],
+            'cue_intensities': {_CUE_KEYS[k]: v for k, v in self.cue_intensities.items()},
             'neighbor_pressure': self.neighbor_pressure,
             'is_receiving_overflow': self.is_receiving_overflow,
         }
+    
+    def copy(self) -> 'AttractionSnapshot':
+        """Return an independent copy (for retaining a reused snapshot)."""
+        return AttractionSnapshot(
+            region_id=self.region_id,
+            population=self.population,
+            attraction_strength=self.attraction_strength,
+            attraction_value=self.attraction_value,
+            signal_boosts=dict(self.signal_boosts),
+            active_cues=list(self.active_cues),
+            cue_intensities=dict(self.cue_intensities),
+            neighbor_pressure=self.neighbor_pressure,
+            is_receiving_overflow=self.is_receiving_overflow,
+        )
 
 
 # =============================================================================
@@ -243,9 +282,16 @@ class AttractionManager:
         AttractionStrength.BEACON,
     ]
     
+    # Index into STRENGTH_ORDER for each strength
+    _STRENGTH_INDEX = {strength: i for i, strength in enumerate(STRENGTH_ORDER)}
+    
+    # Smoothed values within this distance of their targets are settled
+    SETTLE_EPSILON = 1e-4
+    
     def __init__(self, region_id: str, 
                  config: Optional[AttractionConfig] = None,
-                 position: Tuple[float, float] = (0.0, 0.0)):
+                 position: Tuple[float, float] = (0.0, 0.0),
+                 reuse_snapshots: bool = False):
         """
         Initialize attraction manager.
         
@@ -253,6 +299,9 @@ class AttractionManager:
             region_id: Unique identifier for the region
             config: Attraction configuration
             position: Region position for cross-region calculations
+            reuse_snapshots: Refill one snapshot object in place every tick
+                instead of allocating a new one. Snapshots are then only
+                valid until the next update(); use snapshot.copy() to keep one.
         """
         self.region_id = region_id
         self.config = config or AttractionConfig()
@@ -264,6 +313,79 @@ class AttractionManager:
         )
         
         self._time = 0.0
+        
+        # Settled snapshot served (copied unless reused) while inputs are unchanged
+        self._cached_snapshot: Optional[AttractionSnapshot] = None
+        self._cached_population = 0.0
+        self._cached_neighbor_pressure = 0.0
+        
+        # Bumped whenever state that feeds the UE5 parameters may change
+        self._revision = 0
+        
+        # Preallocated snapshot refilled each tick when reuse is enabled
+        self._snapshot: Optional[AttractionSnapshot] = (
+            AttractionSnapshot(region_id=region_id) if reuse_snapshots else None
+        )
+        
+        self._bake_config()
+    
+    def set_config(self, config: AttractionConfig) -> None:
+        """Replace the attraction configuration and re-derive the lookup tables."""
+        self.config = config
+        self._bake_config()
+        
+        # The settled state was reached under the old config
+        self._cached_snapshot = None
+        self._revision += 1
+    
+    def _bake_config(self) -> None:
+        """Flatten the thresholds and per-strength signal/cue tables."""
+        cfg = self.config
+        
+        # Ascending population thresholds; the number of thresholds at or
+        # below a population counts down from BEACON
+        self._pop_thresholds = (
+            cfg.beacon_max_pop,
+            cfg.strong_max_pop,
+            cfg.moderate_max_pop,
+            cfg.subtle_max_pop,
+        )
+        
+        # Per strength index: (signal, target boost) pairs
+        self._signal_targets = tuple(
+            tuple(
+                (signal, cfg.signal_boosts.get(strength, {}).get(signal, 0.0))
+                for signal in AttractionSignal
+            )
+            for strength in self.STRENGTH_ORDER
+        )
+        
+        # Per strength index: (cue, intensity) pairs and the set of active
+        # cues. Cues depend only on strength, so they are fixed per level.
+        cue_thresholds = [
+            (cue, self._STRENGTH_INDEX[threshold])
+            for cue, threshold in cfg.distant_cue_thresholds.items()
+        ]
+        levels = len(self.STRENGTH_ORDER)
+        self._cue_levels = tuple(
+            tuple(
+                (cue, min(1.0, (strength_idx - threshold_idx + 1) / levels)
+                 if strength_idx >= threshold_idx else 0.0)
+                for cue, threshold_idx in cue_thresholds
+            )
+            for strength_idx in range(levels)
+        )
+        self._active_cue_sets = tuple(
+            frozenset(cue for cue, intensity in cue_level if intensity > 0.0)
+            for cue_level in self._cue_levels
+        )
+        self._spawn_cue_levels = tuple(
+            tuple(
+                (cue, intensity) for cue, intensity in cue_level
+                if intensity >= _CUE_SPAWN_MIN_INTENSITY
+            )
+            for cue_level in self._cue_levels
+        )
     
     def set_population(self, population: float) -> None:
         """Set current population ratio (0.0 to 1.0)."""
@@ -271,13 +393,24 @@ class AttractionManager:
     
     def set_neighbor_pressure(self, pressure: float) -> None:
         """Set pressure from neighboring crowded regions (0.0 to 1.0)."""
-        self.state.neighbor_pressure = max(0.0, min(1.0, pressure))
+        clamped = max(0.0, min(1.0, pressure))
+        if clamped != self.state.neighbor_pressure:
+            self._revision += 1
+        self.state.neighbor_pressure = clamped
         self.state.is_receiving_overflow = pressure > 0.5
     
     def update(self, delta_time: float) -> AttractionSnapshot:
         """
         Update attraction state for one tick.
         
+        Once the smoothed attraction value and signal boosts are within
+        SETTLE_EPSILON of their targets they are snapped onto the targets
+        (so reported values can differ from unsnapped smoothing by up to
+        SETTLE_EPSILON). While settled and with population and neighbor
+        pressure unchanged, the tick skips recomputation: a copy of the
+        settled snapshot is returned, or the reused snapshot itself when
+        reuse_snapshots is enabled.
+        
         Args:
             delta_time: Time since last update in seconds
             
@@ -285,21 +418,28 @@ class AttractionManager:
             Current attraction snapshot
         """
         self._time += delta_time
+        
+        cached = self._cached_snapshot
+        if (cached is not None
+                and self.state.population == self._cached_population
+                and self.state.neighbor_pressure == self._cached_neighbor_pressure):
+            return cached if cached is self._snapshot else cached.copy()
+        
+        self._revision += 1
         cfg = self.config
         
         # Determine base attraction strength from population
-        base_strength = self._get_attraction_strength(self.state.population)
+        strength_idx = self._get_strength_index(self.state.population)
         
         # Boost attraction if neighbors are crowded
         if self.state.neighbor_pressure > 0.5:
             # Crowded neighbors make this region more attractive
-            boost_level = min(2, self.STRENGTH_ORDER.index(base_strength) + 1)
-            base_strength = self.STRENGTH_ORDER[boost_level]
+            strength_idx = min(2, strength_idx + 1)
         
-        self.state.attraction_strength = base_strength
+        self.state.attraction_strength = self.STRENGTH_ORDER[strength_idx]
+        self.state.strength_index = strength_idx
         
         # Calculate target attraction value (0-1)
-        strength_idx = self.STRENGTH_ORDER.index(base_strength)
         self.state.target_attraction = strength_idx / (len(self.STRENGTH_ORDER) - 1)
         
         # Smooth transition
@@ -313,71 +453,107 @@ class AttractionManager:
         # Update distant cues
         self._update_distant_cues()
         
-        return self._create_snapshot()
+        settled = self._settle()
+        snapshot = self._create_snapshot()
+        
+        if settled:
+            # Keep a private copy unless the snapshot is the reused buffer,
+            # so callers editing a returned snapshot cannot alter later ones
+            self._cached_snapshot = (
+                snapshot if snapshot is self._snapshot else snapshot.copy()
+            )
+            self._cached_population = self.state.population
+            self._cached_neighbor_pressure = self.state.neighbor_pressure
+        else:
+            self._cached_snapshot = None
+        
+        return snapshot
+    
+    def _get_strength_index(self, population: float) -> int:
+        """Determine attraction strength (as STRENGTH_ORDER index) from population."""
+        # Lower population = higher attraction
+        return len(self._pop_thresholds) - bisect_right(self._pop_thresholds, population)
     
     def _get_attraction_strength(self, population: float) -> AttractionStrength:
         """Determine attraction strength from population."""
-        cfg = self.config
-        
-        # Lower population = higher attraction
-        if population < cfg.beacon_max_pop:
-            return AttractionStrength.BEACON
-        elif population < cfg.strong_max_pop:
-            return AttractionStrength.STRONG
-        elif population < cfg.moderate_max_pop:
-            return AttractionStrength.MODERATE
-        elif population < cfg.subtle_max_pop:
-            return AttractionStrength.SUBTLE
-        else:
-            return AttractionStrength.NONE
+        return self.STRENGTH_ORDER[self._get_strength_index(population)]
     
     def _update_signals(self) -> None:
         """Update attraction signal boosts."""
-        cfg = self.config
-        strength = self.state.attraction_strength
-        
-        boosts = cfg.signal_boosts.get(strength, {})
+        rate = self.config.smoothing_rate
+        signal_boosts = self.state.signal_boosts
         
-        for signal in AttractionSignal:
-            target = boosts.get(signal, 0.0)
-            current = self.state.signal_boosts.get(signal, 0.0)
+        for signal, target in self._signal_targets[self.state.strength_index]:
+            current = signal_boosts.get(signal, 0.0)
             
             # Smooth transition
             diff = target - current
-            self.state.signal_boosts[signal] = current + diff * cfg.smoothing_rate
+            signal_boosts[signal] = current + diff * rate
     
     def _update_distant_cues(self) -> None:
         """Update active distant cues based on attraction strength."""
-        cfg = self.config
-        strength = self.state.attraction_strength
-        strength_idx = self.STRENGTH_ORDER.index(strength)
+        strength_idx = self.state.strength_index
+        cue_intensities = self.state.cue_intensities
+        
+        # Intensity grows with how far strength is above each cue's threshold
+        for cue, intensity in self._cue_levels[strength_idx]:
+            cue_intensities[cue] = intensity
         
         self.state.active_cues.clear()
+        self.state.active_cues.update(self._active_cue_sets[strength_idx])
+        self.state.spawn_cues = self._spawn_cue_levels[strength_idx]
+    
+    def _settle(self) -> bool:
+        """
+        Snap smoothed values onto their targets once they are close enough.
         
-        for cue, threshold in cfg.distant_cue_thresholds.items():
-            threshold_idx = self.STRENGTH_ORDER.index(threshold)
-            
-            if strength_idx >= threshold_idx:
-                self.state.active_cues.add(cue)
-                
-                # Calculate intensity based on how far above threshold
-                intensity = (strength_idx - threshold_idx + 1) / len(self.STRENGTH_ORDER)
-                self.state.cue_intensities[cue] = min(1.0, intensity)
-            else:
-                self.state.cue_intensities[cue] = 0.0
+        Returns:
+            True if the state has reached its fixed point for the current
+            inputs, so further updates would not change it.
+        """
+        state = self.state
+        eps = self.SETTLE_EPSILON
+        
+        if abs(state.target_attraction - state.attraction_value) >= eps:
+            return False
+        
+        signal_targets = self._signal_targets[state.strength_index]
+        signal_boosts = state.signal_boosts
+        for signal, target in signal_targets:
+            if abs(target - signal_boosts.get(signal, 0.0)) >= eps:
+                return False
+        
+        state.attraction_value = state.target_attraction
+        for signal, target in signal_targets:
+            signal_boosts[signal] = target
+        return True
     
     def _create_snapshot(self) -> AttractionSnapshot:
         """Create a snapshot of current attraction state."""
+        state = self.state
+        snapshot = self._snapshot
+        
+        if snapshot is not None:
+            snapshot.population = state.population
+            snapshot.attraction_strength = state.attraction_strength
+            snapshot.attraction_value = state.attraction_value
+            snapshot.signal_boosts.update(state.signal_boosts)
+            snapshot.active_cues[:] = state.active_cues
+            snapshot.cue_intensities.update(state.cue_intensities)
+            snapshot.neighbor_pressure = state.neighbor_pressure
+            snapshot.is_receiving_overflow = state.is_receiving_overflow
+            return snapshot
+        
         return AttractionSnapshot(
             region_id=self.region_id,
-            population=self.state.population,
-            attraction_strength=self.state.attraction_strength,
-            attraction_value=self.state.attraction_value,
-            signal_boosts=dict(self.state.signal_boosts),
-            active_cues=list(self.state.active_cues),
-            cue_intensities=dict(self.state.cue_intensities),
-            neighbor_pressure=self.state.neighbor_pressure,
-            is_receiving_overflow=self.state.is_receiving_overflow,
+            population=state.population,
+            attraction_strength=state.attraction_strength,
+            attraction_value=state.attraction_value,
+            signal_boosts=dict(state.signal_boosts),
+            active_cues=list(state.active_cues),
+            cue_intensities=dict(state.cue_intensities),
+            neighbor_pressure=state.neighbor_pressure,
+            is_receiving_overflow=state.is_receiving_overflow,
         )
     
     def get_ue5_parameters(self) -> 'FAttractionParameters':
@@ -388,6 +564,7 @@ class AttractionManager:
         """Reset attraction state."""
         self.state.population = 0.0
         self.state.attraction_strength = AttractionStrength.NONE
+        self.state.strength_index = 0
         self.state.attraction_value = 0.0
         self.state.target_attraction = 0.0
         self.state.neighbor_pressure = 0.0
@@ -397,10 +574,13 @@ class AttractionManager:
             self.state.signal_boosts[signal] = 0.0
         
         self.state.active_cues.clear()
+        self.state.spawn_cues = ()
         for cue in DistantCue:
             self.state.cue_intensities[cue] = 0.0
         
         self._time = 0.0
+        self._cached_snapshot = None
+        self._revision += 1
     
     @property
     def attraction_strength(self) -> AttractionStrength:
@@ -416,12 +596,101 @@ class AttractionManager:
     def population(self) -> float:
         """Current population."""
         return self.state.population
+    
+    @property
+    def revision(self) -> int:
+        """Counter that changes whenever the UE5 parameters may have changed."""
+        return self._revision
 
 
 # =============================================================================
 # Cross-Region Coordinator
 # =============================================================================
 
+# Crowded-source count above which neighbor culling uses a uniform grid
+_GRID_MIN_SOURCES = 32
+
+
+def _neighbor_pressures(xs: List[float], ys: List[float], pops: List[float],
+                        radius: float, falloff: float) -> List[float]:
+    """
+    Compute the average pressure each region receives from crowded neighbors.
+    
+    Works on flat per-region lists so distance, radius culling and the
+    per-region average happen in a single pass with no per-pair objects.
+    With many crowded regions, sources are bucketed into a grid of
+    radius-sized cells so each region only visits the 3x3 cells around it.
+    
+    Args:
+        xs: Region X positions
+        ys: Region Y positions
+        pops: Region populations (0-1)
+        radius: Neighbor influence radius
+        falloff: Influence multiplier applied to the linear distance falloff
+        
+    Returns:
+        Average neighbor pressure per region, in input order
+    """
+    # Only crowded regions exert pressure
+    crowded = [j for j, pop in enumerate(pops) if pop > 0.5]
+    pressures = []
+    
+    # Cull on squared distance; only pairs inside the radius need a sqrt
+    radius_sq = radius * radius
+    inv_radius = 1.0 / radius if radius > 0.0 else 0.0
+    
+    grid: Optional[Dict[Tuple[int, int], List[int]]] = None
+    if radius > 0.0 and len(crowded) > _GRID_MIN_SOURCES:
+        grid = {}
+        for j in crowded:
+            key = (int(xs[j] // radius), int(ys[j] // radius))
+            grid.setdefault(key, []).append(j)
+    
+    for i in range(len(pops)):
+        tx = xs[i]
+        ty = ys[i]
+        total_pressure = 0.0
+        influence_count = 0
+        
+        if grid is None:
+            candidates = crowded
+        else:
+            # Anything within the radius lies in an adjacent cell
+            cx = int(tx // radius)
+            cy = int(ty // radius)
+            candidates = []
+            for gx in (cx - 1, cx, cx + 1):
+                for gy in (cy - 1, cy, cy + 1):
+                    cell = grid.get((gx, gy))
+                    if cell:
+                        candidates.extend(cell)
+            # Keep the summation order of the dense path
+            candidates.sort()
+        
+        for j in candidates:
+            if j == i:
+                continue
+            
+            dx = tx - xs[j]
+            dy = ty - ys[j]
+            distance_sq = dx * dx + dy * dy
+            
+            if distance_sq > radius_sq:
+                continue
+            
+            # Influence falls off linearly with distance
+            influence = (1.0 - math.sqrt(distance_sq) * inv_radius) * falloff
+            total_pressure += pops[j] * influence
+            influence_count += 1
+        
+        if influence_count > 0:
+            pressures.append(total_pressure / influence_count)
+        else:
+            pressures.append(0.0)
+    
+    return pressures
+
+
 class AttractionCoordinator:
     """
     Coordinates attraction across multiple regions.
@@ -443,16 +712,29 @@ class AttractionCoordinator:
         >>> # quiet_grove will have boosted attraction due to marketplace pressure
     """
     
-    def __init__(self, config: Optional[AttractionConfig] = None):
+    def __init__(self, config: Optional[AttractionConfig] = None,
+                 reuse_snapshots: bool = False):
         """
         Initialize attraction coordinator.
         
         Args:
             config: Shared attraction configuration
+            reuse_snapshots: Have every region refill one snapshot object in
+                place each tick (see AttractionManager)
         """
         self.config = config or AttractionConfig()
         self.regions: Dict[str, AttractionManager] = {}
+        self.reuse_snapshots = reuse_snapshots
         self._time = 0.0
+        
+        # Most attractive region found during the last update() pass;
+        # _most_attractive_valid is cleared whenever the region set changes
+        self._most_attractive: Optional[str] = None
+        self._most_attractive_valid = False
+        
+        # Per-region UE5 payloads keyed by region, with the manager
+        # revision they were built from
+        self._ue5_cache: Dict[str, Tuple[int, Dict[str, Any]]] = {}
     
     def add_region(self, region_id: str, 
                    position: Tuple[float, float] = (0.0, 0.0)) -> None:
@@ -461,12 +743,23 @@ class AttractionCoordinator:
             region_id=region_id,
             config=self.config,
             position=position,
+            reuse_snapshots=self.reuse_snapshots,
         )
+        self._ue5_cache.pop(region_id, None)
+        self._most_attractive_valid = False
+    
+    def set_config(self, config: AttractionConfig) -> None:
+        """Replace the shared configuration on the coordinator and every region."""
+        self.config = config
+        for manager in self.regions.values():
+            manager.set_config(config)
     
     def remove_region(self, region_id: str) -> None:
         """Remove a region from coordination."""
         if region_id in self.regions:
             del self.regions[region_id]
+            self._ue5_cache.pop(region_id, None)
+            self._most_attractive_valid = False
     
     def set_population(self, region_id: str, population: float) -> None:
         """Set population for a specific region."""
@@ -485,51 +778,39 @@ class AttractionCoordinator:
         """
         self._time += delta_time
         
-        # First, calculate neighbor pressure for each region
-        self._calculate_neighbor_pressures()
+        managers = list(self.regions.values())
+        pressures = self._calculate_neighbor_pressures(managers)
         
-        # Then update each region
+        # Apply neighbor pressure and update each region in a single pass,
+        # tracking the most attractive region along the way
         snapshots = {}
-        for region_id, manager in self.regions.items():
-            snapshots[region_id] = manager.update(delta_time)
+        most_attractive = None
+        best_value = 0.0
+        for manager, pressure in zip(managers, pressures):
+            manager.set_neighbor_pressure(pressure)
+            snapshots[manager.region_id] = manager.update(delta_time)
+            
+            value = manager.state.attraction_value
+            if most_attractive is None or value > best_value:
+                most_attractive = manager.region_id
+                best_value = value
+        
+        self._most_attractive = most_attractive
+        self._most_attractive_valid = True
         
         return snapshots
     
-    def _calculate_neighbor_pressures(self) -> None:
-        """Calculate neighbor pressure for each region."""
+    def _calculate_neighbor_pressures(self, managers: List[AttractionManager]) -> List[float]:
+        """Calculate neighbor pressure for each of the given regions."""
         cfg = self.config
         
-        for target_id, target in self.regions.items():
-            total_pressure = 0.0
-            influence_count = 0
-            
-            for source_id, source in self.regions.items():
-                if source_id == target_id:
-                    continue
-                
-                # Calculate distance
-                dx = target.state.position[0] - source.state.position[0]
-                dy = target.state.position[1] - source.state.position[1]
-                distance = math.sqrt(dx * dx + dy * dy)
-                
-                if distance > cfg.neighbor_influence_radius:
-                    continue
-                
-                # Calculate influence based on distance
-                influence = 1.0 - (distance / cfg.neighbor_influence_radius)
-                influence *= cfg.neighbor_influence_falloff
-                
-                # Only crowded regions exert pressure
-                if source.state.population > 0.5:
-                    pressure = source.state.population * influence
-                    total_pressure += pressure
-                    influence_count += 1
-            
-            # Set average pressure
-            if influence_count > 0:
-                target.set_neighbor_pressure(total_pressure / influence_count)
-            else:
-                target.set_neighbor_pressure(0.0)
+        return _neighbor_pressures(
+            [m.state.position[0] for m in managers],
+            [m.state.position[1] for m in managers],
+            [m.state.population for m in managers],
+            cfg.neighbor_influence_radius,
+            cfg.neighbor_influence_falloff,
+        )
     
     def get_region_parameters(self, region_id: str) -> Optional['FAttractionParameters']:
         """Get UE5 parameters for a specific region."""
@@ -545,14 +826,23 @@ class AttractionCoordinator:
         }
     
     def get_most_attractive_region(self) -> Optional[str]:
-        """Get the region with highest attraction."""
-        if not self.regions:
-            return None
+        """
+        Get the region with highest attraction.
         
-        return max(
-            self.regions.keys(),
-            key=lambda r: self.regions[r].attraction_value
-        )
+        Uses the result tracked by the last update() pass when the region
+        set has not changed since, so repeated queries are O(1).
+        """
+        if not self._most_attractive_valid:
+            if self.regions:
+                self._most_attractive = max(
+                    self.regions.keys(),
+                    key=lambda r: self.regions[r].attraction_value
+                )
+            else:
+                self._most_attractive = None
+            self._most_attractive_valid = True
+        
+        return self._most_attractive
     
     def get_pressure_map(self) -> Dict[str, float]:
         """Get population pressure for all regions."""
@@ -573,16 +863,29 @@ class AttractionCoordinator:
         for manager in self.regions.values():
             manager.reset()
         self._time = 0.0
+        self._most_attractive_valid = False
     
     def to_ue5_json(self) -> Dict[str, Any]:
-        """Generate complete UE5 JSON payload."""
+        """
+        Generate complete UE5 JSON payload.
+        
+        Per-region entries are only rebuilt from the manager state for
+        regions whose state changed since the previous call; unchanged
+        regions get a fresh copy of their cached (flat) dict.
+        """
         most_attractive = self.get_most_attractive_region()
         
+        regions = {}
+        cache = self._ue5_cache
+        for region_id, manager in self.regions.items():
+            cached = cache.get(region_id)
+            if cached is None or cached[0] != manager.revision:
+                cached = (manager.revision, manager.get_ue5_parameters().to_ue5_json())
+                cache[region_id] = cached
+            regions[region_id] = dict(cached[1])
+        
         return {
-            'Regions': {
-                region_id: manager.get_ue5_parameters().to_ue5_json()
-                for region_id, manager in self.regions.items()
-            },
+            'Regions': regions,
             'MostAttractiveRegion': most_attractive,
             'PressureMap': self.get_pressure_map(),
             'AttractionMap': self.get_attraction_map(),
@@ -593,7 +896,7 @@ class AttractionCoordinator:
 # UE5 Parameters
 # =============================================================================
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class FAttractionParameters:
     """UE5-ready attraction parameters."""
     
@@ -622,23 +925,11 @@ class FAttractionParameters:
     
     def to_ue5_json(self) -> Dict[str, Any]:
         """Export as JSON for UE5."""
-        return {
-            'Attraction_Strength': self.attraction_strength,
-            'Attraction_Value': self.attraction_value,
-            'Boost_LightQuality': self.light_quality_boost,
-            'Boost_WildlifeSurge': self.wildlife_surge_boost,
-            'Boost_VisualClarity': self.visual_clarity_boost,
-            'Boost_MotionCoherence': self.motion_coherence_boost,
-            'Boost_NPCVitality': self.npc_vitality_boost,
-            'Cue_LightShafts': self.light_shafts_intensity,
-            'Cue_BirdActivity': self.bird_activity_intensity,
-            'Cue_PeacefulSmoke': self.peaceful_smoke_intensity,
-            'Cue_DistantMovement': self.distant_movement_intensity,
-            'Cue_ClearSky': self.clear_sky_intensity,
-            'Cue_WaterGlints': self.water_glints_intensity,
-            'CrossRegion_NeighborPressure': self.neighbor_pressure,
-            'CrossRegion_IsOverflowTarget': self.is_overflow_target,
-        }
+        return dict(zip(_ATTRACTION_UE5_KEYS, _attraction_ue5_values(self)))
+    
+    def to_json_string(self, indent: int = None) -> str:
+        """Serialize to JSON string."""
+        return ue5_json_string(self.to_ue5_json(), indent)
     
     @classmethod
     def from_manager(cls, manager: AttractionManager) -> 'FAttractionParameters':
@@ -646,45 +937,34 @@ class FAttractionParameters:
         params = cls()
         state = manager.state
         
-        params.attraction_strength = state.attraction_strength.value
+        params.attraction_strength = _STRENGTH_KEYS[state.attraction_strength]
         params.attraction_value = state.attraction_value
         
-        # Signal boosts
-        params.light_quality_boost = state.signal_boosts.get(
-            AttractionSignal.LIGHT_QUALITY, 0.0
-        )
-        params.wildlife_surge_boost = state.signal_boosts.get(
-            AttractionSignal.WILDLIFE_SURGE, 0.0
-        )
-        params.visual_clarity_boost = state.signal_boosts.get(
-            AttractionSignal.VISUAL_CLARITY, 0.0
-        )
-        params.motion_coherence_boost = state.signal_boosts.get(
-            AttractionSignal.MOTION_COHERENCE, 0.0
-        )
-        params.npc_vitality_boost = state.signal_boosts.get(
-            AttractionSignal.NPC_VITALITY, 0.0
-        )
+        # Signal boosts (state dicts are normally fully populated; fall back
+        # to per-key defaults if one isn't)
+        signal_boosts = state.signal_boosts
+        try:
+            boosts = _get_boost_signals(signal_boosts)
+        except KeyError:
+            boosts = tuple(signal_boosts.get(s, 0.0) for s in _BOOST_SIGNALS)
+        (params.light_quality_boost,
+         params.wildlife_surge_boost,
+         params.visual_clarity_boost,
+         params.motion_coherence_boost,
+         params.npc_vitality_boost) = boosts
         
         # Distant cues
-        params.light_shafts_intensity = state.cue_intensities.get(
-            DistantCue.LIGHT_SHAFTS, 0.0
-        )
-        params.bird_activity_intensity = state.cue_intensities.get(
-            DistantCue.BIRD_ACTIVITY, 0.0
-        )
-        params.peaceful_smoke_intensity = state.cue_intensities.get(
-            DistantCue.PEACEFUL_SMOKE, 0.0
-        )
-        params.distant_movement_intensity = state.cue_intensities.get(
-            DistantCue.DISTANT_MOVEMENT, 0.0
-        )
-        params.clear_sky_intensity = state.cue_intensities.get(
-            DistantCue.CLEAR_SKY, 0.0
-        )
-        params.water_glints_intensity = state.cue_intensities.get(
-            DistantCue.WATER_GLINTS, 0.0
-        )
+        cue_intensities = state.cue_intensities
+        try:
+            intensities = _get_param_cues(cue_intensities)
+        except KeyError:
+            intensities = tuple(cue_intensities.get(c, 0.0) for c in _PARAM_CUES)
+        (params.light_shafts_intensity,
+         params.bird_activity_intensity,
+         params.peaceful_smoke_intensity,
+         params.distant_movement_intensity,
+         params.clear_sky_intensity,
+         params.water_glints_intensity) = intensities
         
         # Cross-region
         params.neighbor_pressure = state.neighbor_pressure
@@ -693,11 +973,52 @@ class FAttractionParameters:
         return params
 
 
+# Signals and cues read by FAttractionParameters.from_manager, in field order
+_BOOST_SIGNALS: Tuple[AttractionSignal, ...] = (
+    AttractionSignal.LIGHT_QUALITY,
+    AttractionSignal.WILDLIFE_SURGE,
+    AttractionSignal.VISUAL_CLARITY,
+    AttractionSignal.MOTION_COHERENCE,
+    AttractionSignal.NPC_VITALITY,
+)
+_PARAM_CUES: Tuple[DistantCue, ...] = (
+    DistantCue.LIGHT_SHAFTS,
+    DistantCue.BIRD_ACTIVITY,
+    DistantCue.PEACEFUL_SMOKE,
+    DistantCue.DISTANT_MOVEMENT,
+    DistantCue.CLEAR_SKY,
+    DistantCue.WATER_GLINTS,
+)
+_get_boost_signals = itemgetter(*_BOOST_SIGNALS)
+_get_param_cues = itemgetter(*_PARAM_CUES)
+
+# UE5 key -> FAttractionParameters field, in export order
+_ATTRACTION_UE5_FIELDS: Tuple[Tuple[str, str], ...] = (
+    ('Attraction_Strength', 'attraction_strength'),
+    ('Attraction_Value', 'attraction_value'),
+    ('Boost_LightQuality', 'light_quality_boost'),
+    ('Boost_WildlifeSurge', 'wildlife_surge_boost'),
+    ('Boost_VisualClarity', 'visual_clarity_boost'),
+    ('Boost_MotionCoherence', 'motion_coherence_boost'),
+    ('Boost_NPCVitality', 'npc_vitality_boost'),
+    ('Cue_LightShafts', 'light_shafts_intensity'),
+    ('Cue_BirdActivity', 'bird_activity_intensity'),
+    ('Cue_PeacefulSmoke', 'peaceful_smoke_intensity'),
+    ('Cue_DistantMovement', 'distant_movement_intensity'),
+    ('Cue_ClearSky', 'clear_sky_intensity'),
+    ('Cue_WaterGlints', 'water_glints_intensity'),
+    ('CrossRegion_NeighborPressure', 'neighbor_pressure'),
+    ('CrossRegion_IsOverflowTarget', 'is_overflow_target'),
+)
+_ATTRACTION_UE5_KEYS: Tuple[str, ...] = tuple(k for k, _ in _ATTRACTION_UE5_FIELDS)
+_attraction_ue5_values = attrgetter(*(f for _, f in _ATTRACTION_UE5_FIELDS))
+
+
 # =============================================================================
 # Distant Cue Generator
 # =============================================================================
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class DistantCueCommand:
     """Command for spawning a distant visual cue."""
     cue_type: DistantCue
@@ -708,13 +1029,31 @@ class DistantCueCommand:
     
     def to_ue5_json(self) -> Dict[str, Any]:
         """Export as JSON for UE5."""
+        px, py, pz = self.position
+        dx, dy, dz = self.direction
         return {
-            'CueType': self.cue_type.value,
+            'CueType': _CUE_KEYS[self.cue_type],
             'Intensity': self.intensity,
-            'Position': {'X': self.position[0], 'Y': self.position[1], 'Z': self.position[2]},
-            'Direction': {'X': self.direction[0], 'Y': self.direction[1], 'Z': self.direction[2]},
+            'Position': {'X': px, 'Y': py, 'Z': pz},
+            'Direction': {'X': dx, 'Y': dy, 'Z': dz},
             'Scale': self.scale,
         }
+    
+    def to_json_string(self, indent: int = None) -> str:
+        """Serialize to JSON string."""
+        return ue5_json_string(self.to_ue5_json(), indent)
+
+
+def _spawn_range(defaults: Dict[str, Any]) -> Tuple[float, float, float, float]:
+    """(height_min, height_span, scale_min, scale_span) for a CUE_DEFAULTS entry."""
+    height_min = defaults.get('height_min', 100)
+    height_max = defaults.get('height_max', 500)
+    scale_min, scale_max = defaults.get('scale_range', (0.8, 1.2))
+    return (height_min, height_max - height_min, scale_min, scale_max - scale_min)
+
+
+# Spawn ranges for cue types without CUE_DEFAULTS entries
+_DEFAULT_SPAWN_RANGE = _spawn_range({})
 
 
 class DistantCueGenerator:
@@ -764,44 +1103,72 @@ class DistantCueGenerator:
         """Initialize cue generator."""
         import random
         self._rng = random.Random(42)
+        
+        # (height_min, height_span, scale_min, scale_span) per cue type
+        self._spawn_ranges: Dict[DistantCue, Tuple[float, float, float, float]] = {
+            cue: _spawn_range(defaults) for cue, defaults in self.CUE_DEFAULTS.items()
+        }
     
     def generate_cues(self, manager: AttractionManager) -> List[DistantCueCommand]:
         """Generate distant cue commands for a region."""
-        commands = []
-        state = manager.state
+        commands: List[DistantCueCommand] = []
+        self._append_cues(manager.state, commands)
+        return commands
+    
+    def generate_all_cues(self, coordinator: AttractionCoordinator) -> Dict[str, List[DistantCueCommand]]:
+        """Generate cues for all regions."""
+        append_cues = self._append_cues
+        all_cues: Dict[str, List[DistantCueCommand]] = {}
+        for region_id, manager in coordinator.regions.items():
+            commands: List[DistantCueCommand] = []
+            append_cues(manager.state, commands)
+            all_cues[region_id] = commands
+        return all_cues
+    
+    @staticmethod
+    def encode_all(commands_by_region: Dict[str, List[DistantCueCommand]],
+                   indent: int = None) -> str:
+        """
+        Serialize generate_all_cues() output to one JSON string.
         
-        for cue in state.active_cues:
-            intensity = state.cue_intensities.get(cue, 0.0)
-            if intensity < 0.1:
-                continue
-            
-            defaults = self.CUE_DEFAULTS.get(cue, {})
+        All regions are encoded in a single json.dumps pass instead of
+        one call per command.
+        """
+        payload = {
+            region_id: [cmd.to_ue5_json() for cmd in commands]
+            for region_id, commands in commands_by_region.items()
+        }
+        return ue5_json_string(payload, indent)
+    
+    def _append_cues(self, state: RegionAttractionState,
+                     commands: List[DistantCueCommand]) -> None:
+        """
+        Append spawn commands for a region's active cues that are strong
+        enough to spawn (state.spawn_cues).
+        
+        Draws four uniforms per cue from the generator RNG, in the same
+        order as random()/random()/uniform()/uniform() would.
+        """
+        random = self._rng.random
+        spawn_ranges = self._spawn_ranges
+        base_x, base_y = state.position[0], state.position[1]
+        
+        for cue, intensity in state.spawn_cues:
+            height_min, height_span, scale_min, scale_span = spawn_ranges.get(
+                cue, _DEFAULT_SPAWN_RANGE
+            )
             
             # Generate position
-            pos_x = state.position[0] + (self._rng.random() - 0.5) * 200
-            pos_y = state.position[1] + (self._rng.random() - 0.5) * 200
-            pos_z = self._rng.uniform(
-                defaults.get('height_min', 100),
-                defaults.get('height_max', 500)
-            )
+            pos_x = base_x + (random() - 0.5) * 200
+            pos_y = base_y + (random() - 0.5) * 200
+            pos_z = height_min + height_span * random()
             
             # Generate scale
-            scale_min, scale_max = defaults.get('scale_range', (0.8, 1.2))
-            scale = self._rng.uniform(scale_min, scale_max)
+            scale = scale_min + scale_span * random()
             
-            cmd = DistantCueCommand(
+            commands.append(DistantCueCommand(
                 cue_type=cue,
                 intensity=intensity,
                 position=(pos_x, pos_y, pos_z),
                 scale=scale * intensity,  # Scale with intensity
-            )
-            commands.append(cmd)
-        
-        return commands
-    
-    def generate_all_cues(self, coordinator: AttractionCoordinator) -> Dict[str, List[DistantCueCommand]]:
-        """Generate cues for all regions."""
-        return {
-            region_id: self.generate_cues(manager)
-            for region_id, manager in coordinator.regions.items()
-        }
+            ))
@@ -16,9 +16,14 @@ paths tell the story of what happened here.
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Callable, Dict, List, Optional, Any, Tuple
 from enum import Enum
+from functools import lru_cache
+from operator import attrgetter
 import math
+import struct
+
+from ._common import DATACLASS_SLOTS, ue5_json_string
 
 
 # =============================================================================
@@ -131,6 +136,11 @@ SURFACE_WEAR_MAP: Dict[SurfaceType, List[WearType]] = {
     ],
 }
 
+# Serialized string for each enum member, avoiding Enum.value lookups
+_SURFACE_KEYS: Dict[SurfaceType, str] = {s: s.value for s in SurfaceType}
+_LAYER_KEYS: Dict[WearLayer, str] = {l: l.value for l in WearLayer}
+_WEAR_KEYS: Dict[WearType, str] = {w: w.value for w in WearType}
+
 
 # =============================================================================
 # Configuration
@@ -138,7 +148,14 @@ SURFACE_WEAR_MAP: Dict[SurfaceType, List[WearType]] = {
 
 @dataclass
 class WearConfig:
-    """Configuration for environmental wear system."""
+    """
+    Configuration for environmental wear system.
+    
+    WearManager bakes the rate tables into flat per-surface values when it
+    is constructed; call WearManager.set_config() (or
+    RegionWearManager.set_config() for a region's shared config) after
+    changing a config that is already in use.
+    """
     
     # Population threshold to start accumulating wear
     wear_start_threshold: float = 0.25
@@ -200,13 +217,16 @@ class WearConfig:
         SurfaceType.GRAVEL: 1.2,
         SurfaceType.WATER_EDGE: 0.7,
     })
+    
+    # Track per-layer diagnostics (LayerState.time_at_current) every tick
+    enable_diagnostics: bool = False
 
 
 # =============================================================================
 # Wear State Tracking
 # =============================================================================
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class LayerState:
     """State tracking for a single wear layer."""
     layer: WearLayer
@@ -216,10 +236,10 @@ class LayerState:
     recovery_rate: float = 0.0
     is_accumulating: bool = False
     is_recovering: bool = False
-    time_at_current: float = 0.0
+    time_at_current: float = 0.0  # Only tracked with WearConfig.enable_diagnostics
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class SurfaceState:
     """State tracking for a surface area."""
     surface_type: SurfaceType
@@ -239,7 +259,7 @@ class SurfaceState:
                 self.layers[layer] = LayerState(layer=layer)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class WearSnapshot:
     """Snapshot of environmental wear state."""
     population: float = 0.0
@@ -262,12 +282,141 @@ class WearSnapshot:
         """Convert to dictionary."""
         return {
             'population': self.population,
-            'layer_values': {k.value: v for k, v in self.layer_values.items()},
-            'active_effects': {k.value: v for k, v in self.active_effects.items()},
+            'layer_values': {_LAYER_KEYS[k]: v for k, v in self.layer_values.items()},
+            'active_effects': {_WEAR_KEYS[k]: v for k, v in self.active_effects.items()},
             'total_wear': self.total_wear,
             'is_accumulating': self.is_accumulating,
             'is_recovering': self.is_recovering,
         }
+    
+    def copy(self) -> 'WearSnapshot':
+        """Return an independent copy (for retaining a reused snapshot)."""
+        return WearSnapshot(
+            population=self.population,
+            layer_values=dict(self.layer_values),
+            surface_states=dict(self.surface_states),
+            active_effects=dict(self.active_effects),
+            total_wear=self.total_wear,
+            is_accumulating=self.is_accumulating,
+            is_recovering=self.is_recovering,
+        )
+
+
+# Position of each layer in the flat value sequences used by the update kernel
+_DISP, _DISC, _DAM = 0, 1, 2
+_LAYERS: Tuple[WearLayer, WearLayer, WearLayer] = (
+    WearLayer.DISPLACEMENT, WearLayer.DISCOLORATION, WearLayer.DAMAGE,
+)
+_LAYER_INDEX: Dict[WearLayer, int] = {
+    WearLayer.DISPLACEMENT: _DISP,
+    WearLayer.DISCOLORATION: _DISC,
+    WearLayer.DAMAGE: _DAM,
+}
+
+# Layer index for every wear type (WEAR_LAYER_MAP resolved through _LAYER_INDEX)
+_WEAR_TYPE_LAYER_INDEX: Dict[WearType, int] = {
+    wear_type: _LAYER_INDEX[WEAR_LAYER_MAP.get(wear_type, WearLayer.DISPLACEMENT)]
+    for wear_type in WearType
+}
+
+
+# Surface-independent part of a flattened WearConfig: per-layer
+# (accumulation, recovery, max_wear) triples in _LAYER_INDEX order,
+# (wear_start_threshold, recovery_threshold), and indexed cascade triples
+_WearConfigValues = Tuple[
+    Tuple[float, float, float],
+    Tuple[float, float, float],
+    Tuple[float, float, float],
+    Tuple[float, float],
+    Tuple[Tuple[int, int, float], ...],
+]
+
+
+def _flatten_wear_config(cfg: WearConfig) -> _WearConfigValues:
+    """Flatten the Enum-keyed WearConfig tables into hashable tuples."""
+    layers = _LAYERS
+    return (
+        tuple(cfg.accumulation_rates.get(l, 0.01) for l in layers),
+        tuple(cfg.recovery_rates.get(l, 0.001) for l in layers),
+        tuple(cfg.max_wear.get(l, 1.0) for l in layers),
+        (cfg.wear_start_threshold, cfg.recovery_threshold),
+        tuple(
+            (_LAYER_INDEX[from_layer], _LAYER_INDEX[to_layer], rate)
+            for (from_layer, to_layer), rate in cfg.cascade_rates.items()
+        ),
+    )
+
+
+@lru_cache(maxsize=128)
+def _make_layer_stepper(accumulation_rates: Tuple[float, float, float],
+                        recovery_rates: Tuple[float, float, float],
+                        max_wear: Tuple[float, float, float],
+                        surf_mult: float,
+                        surf_recovery_mult: float,
+                        wear_start_threshold: float,
+                        recovery_threshold: float,
+                        cascades: Tuple[Tuple[int, int, float], ...]
+                        ) -> Callable[[List[float], float, float], Tuple[bool, bool]]:
+    """
+    Build a per-tick wear kernel specialized for one surface and config.
+    
+    A WearManager's surface type is fixed for its lifetime, so the surface
+    multipliers and every other constant are bound as closure variables.
+    The arithmetic keeps the reference multiplication order
+    (rate * factor * surface multiplier * delta_time), so results are
+    bit-identical to the unspecialized update. Values are indexed by
+    _LAYER_INDEX; cascades are (from_index, to_index, rate) triples applied
+    in order after accumulation/recovery.
+    
+    The returned step(values, population, delta_time) advances the three
+    layer values in place and returns the (is_accumulating, is_recovering)
+    flags shared by all layers. It holds no state of its own, so kernels
+    are memoized on their (hashable) arguments and shared by every manager
+    with the same surface type and config values, e.g. all same-surface
+    zones of a region.
+    """
+    accum_disp, accum_disc, accum_dam = accumulation_rates
+    recover_disp, recover_disc, recover_dam = recovery_rates
+    max_disp, max_disc, max_dam = max_wear
+    accum_span = 1.0 - wear_start_threshold
+    cascades = tuple(
+        (from_i, to_i, rate, max_wear[to_i]) for from_i, to_i, rate in cascades
+    )
+    
+    def step(values: List[float], population: float, delta_time: float) -> Tuple[bool, bool]:
+        if population >= wear_start_threshold:
+            pop_factor = (population - wear_start_threshold) / accum_span
+            values[_DISP] = min(
+                max_disp, values[_DISP] + accum_disp * pop_factor * surf_mult * delta_time)
+            values[_DISC] = min(
+                max_disc, values[_DISC] + accum_disc * pop_factor * surf_mult * delta_time)
+            values[_DAM] = min(
+                max_dam, values[_DAM] + accum_dam * pop_factor * surf_mult * delta_time)
+            flags = (True, False)
+        elif population <= recovery_threshold:
+            recovery_factor = 1.0 - (population / recovery_threshold)
+            values[_DISP] = max(
+                0.0, values[_DISP] - recover_disp * recovery_factor * surf_recovery_mult * delta_time)
+            values[_DISC] = max(
+                0.0, values[_DISC] - recover_disc * recovery_factor * surf_recovery_mult * delta_time)
+            values[_DAM] = max(
+                0.0, values[_DAM] - recover_dam * recovery_factor * surf_recovery_mult * delta_time)
+            flags = (False, True)
+        else:
+            # In between - no change
+            flags = (False, False)
+        
+        # Layer cascade (higher layers contribute to lower), only when significant.
+        # No cascade can fire unless some layer is already above 0.5.
+        if cascades and max(values) > 0.5:
+            for from_i, to_i, rate, to_max in cascades:
+                from_value = values[from_i]
+                if from_value > 0.5:
+                    values[to_i] = min(to_max, values[to_i] + from_value * rate * delta_time * 0.1)
+        
+        return flags
+    
+    return step
 
 
 # =============================================================================
@@ -294,13 +443,17 @@ class WearManager:
     
     def __init__(self, 
                  surface_type: SurfaceType = SurfaceType.GRASS,
-                 config: Optional[WearConfig] = None):
+                 config: Optional[WearConfig] = None,
+                 reuse_snapshots: bool = False):
         """
         Initialize wear manager.
         
         Args:
             surface_type: Primary surface type for this region
             config: Wear configuration
+            reuse_snapshots: Refill one snapshot object in place every tick
+                instead of allocating a new one. Snapshots are then only
+                valid until the next update(); use snapshot.copy() to keep one.
         """
         self.config = config or WearConfig()
         self.surface_type = surface_type
@@ -308,21 +461,93 @@ class WearManager:
         # Initialize surface state
         self.surface = SurfaceState(surface_type=surface_type)
         
+        # Layer states in _LAYER_INDEX order, so hot paths index by position
+        # instead of hashing WearLayer keys into surface.layers
+        layers = self.surface.layers
+        self._layer_states: Tuple[LayerState, LayerState, LayerState] = tuple(
+            layers[layer] for layer in _LAYERS
+        )
+        
         # Get applicable wear types for this surface
         self.applicable_wear = SURFACE_WEAR_MAP.get(surface_type, [])
         
+        # Applicable wear types grouped by layer index, broadcast in update()
+        # (every effect in a layer takes that layer's value)
+        grouped = tuple(
+            tuple(wt for wt in self.applicable_wear if _WEAR_TYPE_LAYER_INDEX[wt] == i)
+            for i in (_DISP, _DISC, _DAM)
+        )
+        self._effects_by_layer: Tuple[Tuple[int, Tuple[WearType, ...]], ...] = tuple(
+            (i, group) for i, group in enumerate(grouped) if group
+        )
+        
         # Initialize active effects
         for wear_type in self.applicable_wear:
             self.surface.active_effects[wear_type] = 0.0
         
+        self._bake_config()
+        
         # Global state
         self._population = 0.0
         self._time = 0.0
+        
+        # Accumulate/recover branch taken by the last update (shared by all layers)
+        self._is_accumulating = False
+        self._is_recovering = False
+        
+        # UE5 values memoized on the exact layer values they were built from
+        self._ue5_key: Optional[Tuple[float, float, float]] = None
+        self._ue5_values: Tuple[float, ...] = ()
+        
+        # Preallocated snapshot refilled each tick when reuse is enabled
+        self._snapshot: Optional[WearSnapshot] = None
+        if reuse_snapshots:
+            self._snapshot = WearSnapshot(
+                layer_values={layer: 0.0 for layer in WearLayer},
+                active_effects=dict(self.surface.active_effects),
+            )
     
     def set_population(self, population: float) -> None:
         """Set current population ratio (0.0 to 1.0)."""
         self._population = max(0.0, min(1.0, population))
     
+    def set_config(self, config: WearConfig,
+                   values: Optional[_WearConfigValues] = None) -> None:
+        """
+        Replace the wear configuration and re-derive the baked rates.
+        
+        Args:
+            config: New wear configuration
+            values: The config's tables already flattened by
+                _flatten_wear_config(), when several managers share one
+                config (see RegionWearManager.set_config)
+        """
+        self.config = config
+        self._bake_config(values)
+    
+    def _bake_config(self, values: Optional[_WearConfigValues] = None) -> None:
+        """
+        Flatten the Enum-keyed config tables into this surface's kernel.
+        
+        values may be passed in (via set_config) when several managers
+        share one config, so it is flattened only once.
+        """
+        cfg = self.config
+        if values is None:
+            values = _flatten_wear_config(cfg)
+        accumulation, recovery, max_wear, thresholds, cascades = values
+        
+        self._enable_diagnostics = cfg.enable_diagnostics
+        self._step_layers = _make_layer_stepper(
+            accumulation,
+            recovery,
+            max_wear,
+            cfg.surface_multipliers.get(self.surface_type, 1.0),
+            cfg.surface_recovery_multipliers.get(self.surface_type, 1.0),
+            *thresholds,
+            cascades,
+        )
+    
     def update(self, delta_time: float) -> WearSnapshot:
         """
         Update wear state for one tick.
@@ -333,127 +558,84 @@ class WearManager:
         Returns:
             Current wear snapshot
         """
-        self._time += delta_time
-        cfg = self.config
+        snapshot = self._snapshot
+        if snapshot is None:
+            snapshot = WearSnapshot()
+        return self.update_into(delta_time, snapshot)
+    
+    def update_into(self, delta_time: float, out: WearSnapshot) -> WearSnapshot:
+        """
+        Update wear state for one tick, writing the snapshot into out.
         
-        # Get surface multipliers
-        surf_mult = cfg.surface_multipliers.get(self.surface_type, 1.0)
-        surf_recovery_mult = cfg.surface_recovery_multipliers.get(self.surface_type, 1.0)
+        Lets callers keep their own snapshot buffers instead of receiving
+        a new object per tick. out should only ever be filled from this
+        manager (its effect map is updated, not cleared).
         
-        # Update each layer
-        for layer in WearLayer:
-            layer_state = self.surface.layers[layer]
-            
-            # Determine if accumulating or recovering
-            if self._population >= cfg.wear_start_threshold:
-                # Accumulating
-                layer_state.is_accumulating = True
-                layer_state.is_recovering = False
-                
-                # Calculate accumulation amount
-                base_rate = cfg.accumulation_rates.get(layer, 0.01)
-                pop_factor = (self._population - cfg.wear_start_threshold) / (1.0 - cfg.wear_start_threshold)
-                accum = base_rate * pop_factor * surf_mult * delta_time
-                
-                layer_state.value = min(
-                    cfg.max_wear.get(layer, 1.0),
-                    layer_state.value + accum
-                )
-                
-            elif self._population <= cfg.recovery_threshold:
-                # Recovering
-                layer_state.is_accumulating = False
-                layer_state.is_recovering = True
-                
-                # Calculate recovery amount
-                base_rate = cfg.recovery_rates.get(layer, 0.001)
-                recovery_factor = 1.0 - (self._population / cfg.recovery_threshold)
-                recovery = base_rate * recovery_factor * surf_recovery_mult * delta_time
-                
-                layer_state.value = max(0.0, layer_state.value - recovery)
-                
-            else:
-                # In between - no change
-                layer_state.is_accumulating = False
-                layer_state.is_recovering = False
+        Args:
+            delta_time: Time since last update in seconds
+            out: Snapshot to overwrite
             
-            layer_state.time_at_current += delta_time
+        Returns:
+            out
+        """
+        self._time += delta_time
         
-        # Apply layer cascade (higher layers contribute to lower)
-        for (from_layer, to_layer), cascade_rate in cfg.cascade_rates.items():
-            from_state = self.surface.layers[from_layer]
-            to_state = self.surface.layers[to_layer]
-            
-            if from_state.value > 0.5:  # Only cascade when significant
-                cascade_amount = from_state.value * cascade_rate * delta_time * 0.1
-                to_state.value = min(
-                    cfg.max_wear.get(to_layer, 1.0),
-                    to_state.value + cascade_amount
-                )
+        layer_states = self._layer_states
+        values = [state.value for state in layer_states]
         
-        # Update active effects based on layer values
-        self._update_active_effects()
+        self._is_accumulating, self._is_recovering = self._step_layers(
+            values, self._population, delta_time
+        )
         
-        # Calculate aggregates
-        self._calculate_aggregates()
+        is_accumulating = self._is_accumulating
+        is_recovering = self._is_recovering
+        for state, value in zip(layer_states, values):
+            state.value = value
+            state.is_accumulating = is_accumulating
+            state.is_recovering = is_recovering
         
-        return self._create_snapshot()
-    
-    def _update_active_effects(self) -> None:
-        """Update individual wear effects based on layer values."""
-        for wear_type in self.applicable_wear:
-            layer = WEAR_LAYER_MAP.get(wear_type, WearLayer.DISPLACEMENT)
-            layer_value = self.surface.layers[layer].value
-            
-            # Effect strength is based on layer value
-            self.surface.active_effects[wear_type] = layer_value
-    
-    def _calculate_aggregates(self) -> None:
-        """Calculate aggregate wear values."""
-        # Total wear is weighted sum of layers
-        weights = {
-            WearLayer.DISPLACEMENT: 0.3,
-            WearLayer.DISCOLORATION: 0.4,
-            WearLayer.DAMAGE: 0.3,
-        }
+        if self._enable_diagnostics:
+            for state in layer_states:
+                state.time_at_current += delta_time
         
-        self.surface.total_wear = sum(
-            self.surface.layers[layer].value * weight
-            for layer, weight in weights.items()
-        )
+        surface = self.surface
         
-        # Visual wear emphasizes displacement (most immediately visible)
-        visual_weights = {
-            WearLayer.DISPLACEMENT: 0.5,
-            WearLayer.DISCOLORATION: 0.35,
-            WearLayer.DAMAGE: 0.15,
-        }
+        # Active effects: each takes its layer's value
+        effects = surface.active_effects
+        for layer_index, wear_types in self._effects_by_layer:
+            value = values[layer_index]
+            for wear_type in wear_types:
+                effects[wear_type] = value
         
-        self.surface.visual_wear = sum(
-            self.surface.layers[layer].value * weight
-            for layer, weight in visual_weights.items()
-        )
+        # Aggregates: total wear is a weighted sum of layers; visual wear
+        # emphasizes displacement (most immediately visible)
+        v0, v1, v2 = values
+        surface.total_wear = v0 * 0.3 + v1 * 0.4 + v2 * 0.3
+        surface.visual_wear = v0 * 0.5 + v1 * 0.35 + v2 * 0.15
+        
+        return self._fill_snapshot(out)
     
     def _create_snapshot(self) -> WearSnapshot:
         """Create a snapshot of current wear state."""
-        snapshot = WearSnapshot()
+        snapshot = self._snapshot
+        if snapshot is None:
+            snapshot = WearSnapshot()
+        return self._fill_snapshot(snapshot)
+    
+    def _fill_snapshot(self, snapshot: WearSnapshot) -> WearSnapshot:
+        """Write the current wear state into snapshot."""
+        snapshot.active_effects.update(self.surface.active_effects)
         snapshot.population = self._population
         
         # Layer values
-        for layer in WearLayer:
-            snapshot.layer_values[layer] = self.surface.layers[layer].value
-        
-        # Active effects
-        snapshot.active_effects = dict(self.surface.active_effects)
+        layer_values = snapshot.layer_values
+        for layer, state in zip(_LAYERS, self._layer_states):
+            layer_values[layer] = state.value
         
         # Aggregates
         snapshot.total_wear = self.surface.total_wear
-        snapshot.is_accumulating = any(
-            self.surface.layers[l].is_accumulating for l in WearLayer
-        )
-        snapshot.is_recovering = any(
-            self.surface.layers[l].is_recovering for l in WearLayer
-        )
+        snapshot.is_accumulating = self._is_accumulating
+        snapshot.is_recovering = self._is_recovering
         
         return snapshot
     
@@ -461,10 +643,24 @@ class WearManager:
         """Generate UE5-ready wear parameters."""
         return FWearParameters.from_manager(self)
     
+    def _get_ue5_values(self) -> Tuple[float, ...]:
+        """
+        UE5 parameter values in _WEAR_UE5_FIELDS order.
+        
+        Parameters depend only on the three layer values (the surface type
+        is fixed), so the tuple is rebuilt only when one of them changes;
+        stable zones (fully recovered, or saturated) hit the cache.
+        """
+        layers = self._layer_states
+        key = (layers[_DISP].value, layers[_DISC].value, layers[_DAM].value)
+        if key != self._ue5_key:
+            self._ue5_values = _wear_ue5_values(FWearParameters.from_manager(self))
+            self._ue5_key = key
+        return self._ue5_values
+    
     def reset(self) -> None:
         """Reset all wear to zero."""
-        for layer in WearLayer:
-            state = self.surface.layers[layer]
+        for state in self._layer_states:
             state.value = 0.0
             state.target_value = 0.0
             state.is_accumulating = False
@@ -478,6 +674,8 @@ class WearManager:
         self.surface.visual_wear = 0.0
         self._population = 0.0
         self._time = 0.0
+        self._is_accumulating = False
+        self._is_recovering = False
     
     @property
     def total_wear(self) -> float:
@@ -499,7 +697,7 @@ class WearManager:
 # UE5 Parameters
 # =============================================================================
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class FWearParameters:
     """UE5-ready environmental wear parameters."""
     
@@ -535,77 +733,94 @@ class FWearParameters:
     
     def to_ue5_json(self) -> Dict[str, float]:
         """Export as JSON for UE5."""
-        return {
-            'Wear_DisplacementIntensity': self.displacement_intensity,
-            'Wear_DiscolorationIntensity': self.discoloration_intensity,
-            'Wear_DamageIntensity': self.damage_intensity,
-            'Decal_FootprintDensity': self.footprint_density,
-            'Decal_FootprintOpacity': self.footprint_opacity,
-            'Decal_PathBlendAmount': self.path_blend_amount,
-            'Grass_HeightMultiplier': self.grass_height_multiplier,
-            'Grass_BendAmount': self.grass_bend_amount,
-            'Grass_ColorShift': self.grass_color_shift,
-            'Grass_DensityMultiplier': self.grass_density_multiplier,
-            'Ground_Displacement': self.ground_displacement,
-            'Ground_RoughnessMod': self.ground_roughness_mod,
-            'Ground_ColorDarkening': self.ground_color_darkening,
-            'Ground_Wetness': self.ground_wetness,
-            'Dust_Accumulation': self.dust_accumulation,
-            'Debris_Density': self.debris_density,
-            'Erosion_Depth': self.erosion_depth,
-            'Compaction_Amount': self.compaction_amount,
-        }
+        return dict(zip(_WEAR_UE5_KEYS, _wear_ue5_values(self)))
+    
+    def to_ue5_bytes(self) -> bytes:
+        """
+        Export as a packed binary payload for UE5.
+        
+        Little-endian float32 values in to_ue5_json() key order (72 bytes).
+        """
+        return _WEAR_UE5_STRUCT.pack(*_wear_ue5_values(self))
     
     @classmethod
     def from_manager(cls, manager: WearManager) -> 'FWearParameters':
         """Create parameters from wear manager state."""
-        params = cls()
-        surface = manager.surface
-        
-        # Layer intensities
-        params.displacement_intensity = surface.layers[WearLayer.DISPLACEMENT].value
-        params.discoloration_intensity = surface.layers[WearLayer.DISCOLORATION].value
-        params.damage_intensity = surface.layers[WearLayer.DAMAGE].value
-        
-        # Footprints (from displacement)
-        disp = params.displacement_intensity
-        params.footprint_density = disp * 5.0  # 0-5 per sq meter
-        params.footprint_opacity = min(1.0, disp * 1.2)
-        
-        # Path wear (from discoloration)
-        disc = params.discoloration_intensity
-        params.path_blend_amount = disc
+        # Every field is derived up front and passed to a single constructor
+        # call, rather than building defaults and assigning 18 attributes.
+        layers = manager._layer_states
+        disp = layers[_DISP].value
+        disc = layers[_DISC].value
+        dmg = layers[_DAM].value
         
         # Grass parameters (primarily for grass surface)
-        if manager.surface_type == SurfaceType.GRASS:
-            params.grass_height_multiplier = 1.0 - disp * 0.7
-            params.grass_bend_amount = disp
-            params.grass_color_shift = disc * 0.8
-            params.grass_density_multiplier = 1.0 - params.damage_intensity * 0.5
-        
-        # Ground parameters
-        params.ground_displacement = -disp * 0.05  # Negative = pushed down
-        params.ground_roughness_mod = disc * 0.3
-        params.ground_color_darkening = disc * 0.4
-        params.ground_wetness = params.damage_intensity * 0.3
-        
-        # Dust/debris
-        params.dust_accumulation = disc * 0.5
-        params.debris_density = disp * 0.3
-        
-        # Erosion (from damage)
-        dmg = params.damage_intensity
-        params.erosion_depth = dmg * 0.1
-        params.compaction_amount = dmg * 0.8
-        
-        return params
+        if manager.surface_type is SurfaceType.GRASS:
+            grass_height = 1.0 - disp * 0.7
+            grass_bend = disp
+            grass_color = disc * 0.8
+            grass_density = 1.0 - dmg * 0.5
+        else:
+            grass_height, grass_bend, grass_color, grass_density = 1.0, 0.0, 0.0, 1.0
+        
+        return cls(
+            # Layer intensities
+            displacement_intensity=disp,
+            discoloration_intensity=disc,
+            damage_intensity=dmg,
+            # Footprints (from displacement), path wear (from discoloration)
+            footprint_density=disp * 5.0,  # 0-5 per sq meter
+            footprint_opacity=min(1.0, disp * 1.2),
+            path_blend_amount=disc,
+            grass_height_multiplier=grass_height,
+            grass_bend_amount=grass_bend,
+            grass_color_shift=grass_color,
+            grass_density_multiplier=grass_density,
+            # Ground parameters
+            ground_displacement=-disp * 0.05,  # Negative = pushed down
+            ground_roughness_mod=disc * 0.3,
+            ground_color_darkening=disc * 0.4,
+            ground_wetness=dmg * 0.3,
+            # Dust/debris
+            dust_accumulation=disc * 0.5,
+            debris_density=disp * 0.3,
+            # Erosion (from damage)
+            erosion_depth=dmg * 0.1,
+            compaction_amount=dmg * 0.8,
+        )
+
+
+# UE5 key -> FWearParameters field, in export order
+_WEAR_UE5_FIELDS: Tuple[Tuple[str, str], ...] = (
+    ('Wear_DisplacementIntensity', 'displacement_intensity'),
+    ('Wear_DiscolorationIntensity', 'discoloration_intensity'),
+    ('Wear_DamageIntensity', 'damage_intensity'),
+    ('Decal_FootprintDensity', 'footprint_density'),
+    ('Decal_FootprintOpacity', 'footprint_opacity'),
+    ('Decal_PathBlendAmount', 'path_blend_amount'),
+    ('Grass_HeightMultiplier', 'grass_height_multiplier'),
+    ('Grass_BendAmount', 'grass_bend_amount'),
+    ('Grass_ColorShift', 'grass_color_shift'),
+    ('Grass_DensityMultiplier', 'grass_density_multiplier'),
+    ('Ground_Displacement', 'ground_displacement'),
+    ('Ground_RoughnessMod', 'ground_roughness_mod'),
+    ('Ground_ColorDarkening', 'ground_color_darkening'),
+    ('Ground_Wetness', 'ground_wetness'),
+    ('Dust_Accumulation', 'dust_accumulation'),
+    ('Debris_Density', 'debris_density'),
+    ('Erosion_Depth', 'erosion_depth'),
+    ('Compaction_Amount', 'compaction_amount'),
+)
+_WEAR_UE5_KEYS: Tuple[str, ...] = tuple(k for k, _ in _WEAR_UE5_FIELDS)
+_wear_ue5_values = attrgetter(*(f for _, f in _WEAR_UE5_FIELDS))
+# Binary layout for to_ue5_bytes(): one little-endian float32 per field
+_WEAR_UE5_STRUCT = struct.Struct('<%df' % len(_WEAR_UE5_FIELDS))
 
 
 # =============================================================================
 # Multi-Zone Wear Tracking
 # =============================================================================
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class WearZone:
     """A zone within a region with its own wear characteristics."""
     zone_id: str
@@ -643,18 +858,26 @@ class RegionWearManager:
         >>> snapshot = region.update(delta_time=0.5)
     """
     
-    def __init__(self, region_id: str, config: Optional[WearConfig] = None):
+    def __init__(self, region_id: str, config: Optional[WearConfig] = None,
+                 reuse_snapshots: bool = False):
         """
         Initialize region wear manager.
         
         Args:
             region_id: Unique identifier for the region
             config: Wear configuration (shared across zones)
+            reuse_snapshots: Have every zone refill one snapshot object in
+                place each tick (see WearManager), and refill one snapshot
+                dict from update() as well
         """
         self.region_id = region_id
         self.config = config or WearConfig()
+        self.reuse_snapshots = reuse_snapshots
         self.zones: Dict[str, WearZone] = {}
         
+        # Zone snapshot dict returned by every update() when reusing snapshots
+        self._snapshots: Dict[str, WearSnapshot] = {}
+        
         self._population = 0.0
         self._time = 0.0
     
@@ -668,7 +891,11 @@ class RegionWearManager:
         zone = WearZone(
             zone_id=zone_id,
             surface_type=surface_type,
-            manager=WearManager(surface_type=surface_type, config=self.config),
+            manager=WearManager(
+                surface_type=surface_type,
+                config=self.config,
+                reuse_snapshots=self.reuse_snapshots,
+            ),
             position=position,
             radius=radius,
             population_weight=population_weight,
@@ -677,6 +904,23 @@ class RegionWearManager:
         )
         self.zones[zone_id] = zone
     
+    def remove_zone(self, zone_id: str) -> None:
+        """Remove a wear zone from the region."""
+        if zone_id in self.zones:
+            del self.zones[zone_id]
+    
+    def set_config(self, config: WearConfig) -> None:
+        """
+        Replace the configuration shared by every zone.
+        
+        The config is flattened once and each zone's wear kernel is
+        re-baked from those shared values.
+        """
+        self.config = config
+        values = _flatten_wear_config(config)
+        for zone in self.zones.values():
+            zone.manager.set_config(config, values)
+    
     def set_population(self, population: float) -> None:
         """Set overall region population."""
         self._population = max(0.0, min(1.0, population))
@@ -684,12 +928,16 @@ class RegionWearManager:
     def update(self, delta_time: float) -> Dict[str, WearSnapshot]:
         """Update all zones."""
         self._time += delta_time
-        snapshots = {}
+        if self.reuse_snapshots:
+            # Refill the same dict, dropping zones removed since last tick
+            snapshots = self._snapshots
+            snapshots.clear()
+        else:
+            snapshots = {}
         
         for zone_id, zone in self.zones.items():
             # Calculate zone-specific population
-            zone_pop = self._calculate_zone_population(zone)
-            zone.manager.set_population(zone_pop)
+            zone.manager.set_population(self._calculate_zone_population(zone))
             
             # Update zone
             snapshots[zone_id] = zone.manager.update(delta_time)
@@ -738,17 +986,26 @@ class RegionWearManager:
     
     def to_ue5_json(self) -> Dict[str, Any]:
         """Generate complete UE5 JSON payload."""
+        # Zone payloads and the aggregate wear are built in one pass
+        zones: Dict[str, Any] = {}
+        total_wear = 0.0
+        for zone_id, zone in self.zones.items():
+            manager = zone.manager
+            total_wear += manager.surface.total_wear
+            zones[zone_id] = {
+                'SurfaceType': _SURFACE_KEYS[zone.surface_type],
+                'IsPath': zone.is_path,
+                'IsGatheringPoint': zone.is_gathering_point,
+                'Parameters': dict(zip(_WEAR_UE5_KEYS, manager._get_ue5_values())),
+            }
+        
         return {
             'RegionID': self.region_id,
             'Population': self._population,
-            'AggregateWear': self.get_aggregate_wear(),
-            'Zones': {
-                zone_id: {
-                    'SurfaceType': zone.surface_type.value,
-                    'IsPath': zone.is_path,
-                    'IsGatheringPoint': zone.is_gathering_point,
-                    'Parameters': zone.manager.get_ue5_parameters().to_ue5_json(),
-                }
-                for zone_id, zone in self.zones.items()
-            },
+            'AggregateWear': total_wear / len(zones) if zones else 0.0,
+            'Zones': zones,
         }
+    
+    def to_json_string(self, indent: int = None) -> str:
+        """Serialize to JSON string."""
+        return ue5_json_string(self.to_ue5_json(), indent)
@@ -20,11 +20,14 @@ anxiety without conscious awareness.
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Callable, Dict, List, Optional, Any, Tuple
 from enum import Enum
+from operator import attrgetter
 import math
 import random
 
+from ._common import DATACLASS_SLOTS, ue5_json_string
+
 
 # =============================================================================
 # Enums and Constants
@@ -56,13 +59,47 @@ class WindPattern(Enum):
     CALM = "calm"               # Minimal wind
 
 
+# Position of each coherence level (UNIFIED..CHAOTIC) in the baked per-level
+# parameter table
+_LEVEL_INDEX: Dict[CoherenceLevel, int] = {
+    level: i for i, level in enumerate(CoherenceLevel)
+}
+
+# Target coherence value per level index (1 = unified, 0 = chaotic)
+_TARGET_COHERENCE: Tuple[float, ...] = tuple(
+    1.0 - (i / (len(_LEVEL_INDEX) - 1)) for i in range(len(_LEVEL_INDEX))
+)
+
+# Default per-level tables, in CoherenceLevel order (UNIFIED..CHAOTIC).
+# Phase offset ranges (radians): nearly synchronized, natural variation,
+# noticeable desync, full desync
+_DEFAULT_PHASE_VARIANCE: Tuple[float, ...] = (0.1, 0.3, 0.8, math.pi)
+# Wind direction variance (degrees)
+_DEFAULT_DIRECTION_VARIANCE: Tuple[float, ...] = (5.0, 15.0, 45.0, 180.0)
+# Animation speed variance
+_DEFAULT_SPEED_VARIANCE: Tuple[float, ...] = (0.05, 0.10, 0.25, 0.50)
+# Settling rate: perfect settling down to never fully settles
+_DEFAULT_SETTLING_RATE: Tuple[float, ...] = (1.0, 0.9, 0.6, 0.2)
+
+# Enum -> wire string tables (avoid Enum.value descriptor lookups in to_dict)
+_CATEGORY_KEYS: Dict[MotionCategory, str] = {c: c.value for c in MotionCategory}
+_LEVEL_KEYS: Dict[CoherenceLevel, str] = {l: l.value for l in CoherenceLevel}
+
+
 # =============================================================================
 # Configuration
 # =============================================================================
 
 @dataclass
 class MotionConfig:
-    """Configuration for motion coherence system."""
+    """
+    Configuration for motion coherence system.
+    
+    MotionManager bakes the per-level variance and settling tables (and the
+    coherence smoothing rate) into flat values when it is constructed; call
+    MotionManager.set_config() after changing those on a config that a
+    manager is already using.
+    """
     
     # Population thresholds for coherence levels
     unified_max_pop: float = 0.15       # Below this = UNIFIED
@@ -75,36 +112,24 @@ class MotionConfig:
     base_wind_strength: float = 0.5     # 0-1
     
     # Phase offset ranges per coherence level (radians)
-    phase_variance: Dict[CoherenceLevel, float] = field(default_factory=lambda: {
-        CoherenceLevel.UNIFIED: 0.1,     # Nearly synchronized
-        CoherenceLevel.NATURAL: 0.3,     # Natural variation
-        CoherenceLevel.VARIED: 0.8,      # Noticeable desync
-        CoherenceLevel.CHAOTIC: math.pi, # Full desync
-    })
+    phase_variance: Dict[CoherenceLevel, float] = field(
+        default_factory=lambda: dict(zip(CoherenceLevel, _DEFAULT_PHASE_VARIANCE))
+    )
     
     # Wind direction variance per coherence level (degrees)
-    direction_variance: Dict[CoherenceLevel, float] = field(default_factory=lambda: {
-        CoherenceLevel.UNIFIED: 5.0,
-        CoherenceLevel.NATURAL: 15.0,
-        CoherenceLevel.VARIED: 45.0,
-        CoherenceLevel.CHAOTIC: 180.0,
-    })
+    direction_variance: Dict[CoherenceLevel, float] = field(
+        default_factory=lambda: dict(zip(CoherenceLevel, _DEFAULT_DIRECTION_VARIANCE))
+    )
     
     # Animation speed variance per coherence level
-    speed_variance: Dict[CoherenceLevel, float] = field(default_factory=lambda: {
-        CoherenceLevel.UNIFIED: 0.05,
-        CoherenceLevel.NATURAL: 0.10,
-        CoherenceLevel.VARIED: 0.25,
-        CoherenceLevel.CHAOTIC: 0.50,
-    })
+    speed_variance: Dict[CoherenceLevel, float] = field(
+        default_factory=lambda: dict(zip(CoherenceLevel, _DEFAULT_SPEED_VARIANCE))
+    )
     
     # Settling behavior (how well things come to rest)
-    settling_rate: Dict[CoherenceLevel, float] = field(default_factory=lambda: {
-        CoherenceLevel.UNIFIED: 1.0,     # Perfect settling
-        CoherenceLevel.NATURAL: 0.9,
-        CoherenceLevel.VARIED: 0.6,
-        CoherenceLevel.CHAOTIC: 0.2,     # Never fully settles
-    })
+    settling_rate: Dict[CoherenceLevel, float] = field(
+        default_factory=lambda: dict(zip(CoherenceLevel, _DEFAULT_SETTLING_RATE))
+    )
     
     # Smoothing rate for transitions
     coherence_smoothing: float = 0.05
@@ -114,7 +139,7 @@ class MotionConfig:
 # Motion Element State
 # =============================================================================
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ElementMotionState:
     """Motion state for a single animated element."""
     element_id: str
@@ -144,7 +169,7 @@ class ElementMotionState:
     jitter_frequency: float = 0.0
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class CategoryState:
     """Aggregate state for a motion category."""
     category: MotionCategory
@@ -175,7 +200,7 @@ class CategoryState:
 # Motion Snapshot
 # =============================================================================
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class MotionSnapshot:
     """Snapshot of motion coherence state."""
     population: float = 0.0
@@ -194,11 +219,30 @@ class MotionSnapshot:
     average_speed_coherence: float = 1.0
     settling_elements_ratio: float = 0.0
     
+    def copy(self) -> 'MotionSnapshot':
+        """
+        Return an independent copy (for retaining a reused snapshot).
+        
+        The category map is copied; its CategoryState values are the
+        manager's live states, as in any snapshot.
+        """
+        return MotionSnapshot(
+            population=self.population,
+            coherence_level=self.coherence_level,
+            coherence_value=self.coherence_value,
+            global_wind_direction=self.global_wind_direction,
+            global_wind_strength=self.global_wind_strength,
+            category_states=dict(self.category_states),
+            average_phase_coherence=self.average_phase_coherence,
+            average_speed_coherence=self.average_speed_coherence,
+            settling_elements_ratio=self.settling_elements_ratio,
+        )
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
         return {
             'population': self.population,
-            'coherence_level': self.coherence_level.value,
+            'coherence_level': _LEVEL_KEYS[self.coherence_level],
             'coherence_value': self.coherence_value,
             'global_wind_direction': self.global_wind_direction,
             'global_wind_strength': self.global_wind_strength,
@@ -206,7 +250,7 @@ class MotionSnapshot:
             'average_speed_coherence': self.average_speed_coherence,
             'settling_elements_ratio': self.settling_elements_ratio,
             'categories': {
-                cat.value: {
+                _CATEGORY_KEYS[cat]: {
                     'phase_coherence': state.phase_coherence,
                     'speed_coherence': state.speed_coherence,
                     'wind_direction': state.wind_direction,
@@ -244,20 +288,29 @@ class MotionManager:
         CoherenceLevel.CHAOTIC,
     ]
     
-    def __init__(self, config: Optional[MotionConfig] = None):
+    def __init__(self, config: Optional[MotionConfig] = None,
+                 reuse_snapshots: bool = False):
         """
         Initialize motion manager.
         
         Args:
             config: Motion configuration
+            reuse_snapshots: Refill one snapshot object in place every tick
+                instead of allocating a new one. Snapshots are then only
+                valid until the next update(); use snapshot.copy() to keep one.
         """
         self.config = config or MotionConfig()
+        self._bake_config()
         
         # Initialize category states
         self.categories: Dict[MotionCategory, CategoryState] = {}
         for category in MotionCategory:
             self.categories[category] = CategoryState(category=category)
         
+        # The same states in MotionCategory order, walked by the per-tick
+        # loops (the category set is fixed, so no dict iteration is needed)
+        self._category_states: Tuple[CategoryState, ...] = tuple(self.categories.values())
+        
         # Configure category-specific defaults
         self._configure_categories()
         
@@ -275,6 +328,33 @@ class MotionManager:
         
         # RNG for variation
         self._rng = random.Random(42)
+        
+        # Preallocated snapshot refilled each tick when reuse is enabled
+        # (the category set is fixed, so its category map is built once)
+        self._snapshot: Optional[MotionSnapshot] = None
+        if reuse_snapshots:
+            self._snapshot = MotionSnapshot(category_states=dict(self.categories))
+    
+    def set_config(self, config: MotionConfig) -> None:
+        """Replace the motion configuration and re-derive the level table."""
+        self.config = config
+        self._bake_config()
+    
+    def _bake_config(self) -> None:
+        """Flatten the Enum-keyed variance dicts into a per-level table."""
+        cfg = self.config
+        # One (phase_var, dir_var, speed_var, settling) row per level,
+        # indexed by _LEVEL_INDEX
+        self._level_params: Tuple[Tuple[float, float, float, float], ...] = tuple(
+            (
+                cfg.phase_variance.get(level, 0.3),
+                cfg.direction_variance.get(level, 15.0),
+                cfg.speed_variance.get(level, 0.1),
+                cfg.settling_rate.get(level, 0.9),
+            )
+            for level in CoherenceLevel
+        )
+        self._coherence_smoothing = cfg.coherence_smoothing
     
     def _configure_categories(self) -> None:
         """Configure category-specific defaults."""
@@ -330,7 +410,10 @@ class MotionManager:
     
     def set_population(self, population: float) -> None:
         """Set current population ratio (0.0 to 1.0)."""
-        self._population = max(0.0, min(1.0, population))
+        # Same result as max(0.0, min(1.0, population)), without the calls
+        self._population = (
+            (population if population > 0.0 else 0.0) if population < 1.0 else 1.0
+        )
     
     def update(self, delta_time: float) -> MotionSnapshot:
         """
@@ -344,27 +427,33 @@ class MotionManager:
         """
         self._time += delta_time
         self._wind_time += delta_time
-        cfg = self.config
         
         # Determine coherence level from population
         self._coherence_level = self._get_coherence_level(self._population)
+        level_idx = _LEVEL_INDEX[self._coherence_level]
         
         # Calculate target coherence value (0 = chaotic, 1 = unified)
-        coherence_idx = self.COHERENCE_ORDER.index(self._coherence_level)
-        self._target_coherence = 1.0 - (coherence_idx / (len(self.COHERENCE_ORDER) - 1))
+        self._target_coherence = _TARGET_COHERENCE[level_idx]
         
         # Smooth coherence transition
         diff = self._target_coherence - self._coherence_value
-        self._coherence_value += diff * min(1.0, delta_time * cfg.coherence_smoothing * 10)
+        blend = delta_time * self._coherence_smoothing * 10
+        self._coherence_value += diff * (blend if blend < 1.0 else 1.0)
+        
+        # Coherence parameters for this tick, looked up once and shared by
+        # the wind and every category
+        level_params = self._level_params[level_idx]
         
         # Update wind
-        self._update_wind(delta_time)
+        self._update_wind(delta_time, level_params[1])
         
-        # Update each category
-        for category, state in self.categories.items():
-            self._update_category(state, delta_time)
+        # Update each category, counting settled elements on the way so the
+        # snapshot doesn't need a second pass over every element
+        settled_elements = 0
+        for state in self._category_states:
+            settled_elements += self._update_category(state, delta_time, level_params)
         
-        return self._create_snapshot()
+        return self._create_snapshot(settled_elements)
     
     def _get_coherence_level(self, population: float) -> CoherenceLevel:
         """Determine coherence level from population."""
@@ -379,16 +468,13 @@ class MotionManager:
         else:
             return CoherenceLevel.CHAOTIC
     
-    def _update_wind(self, delta_time: float) -> None:
-        """Update wind state."""
+    def _update_wind(self, delta_time: float, dir_variance: float) -> None:
+        """Update wind state (dir_variance is the current level's direction variance)."""
         cfg = self.config
         
         # Base wind with time-based variation
         base_dir = cfg.base_wind_direction
         
-        # Add variance based on coherence
-        dir_variance = cfg.direction_variance.get(self._coherence_level, 15.0)
-        
         # Perlin-like smooth variation
         time_factor = math.sin(self._wind_time * 0.1) * 0.5 + 0.5
         dir_offset = (time_factor - 0.5) * dir_variance * 2
@@ -396,24 +482,30 @@ class MotionManager:
         self._wind_direction = (base_dir + dir_offset) % 360
         
         # Wind strength varies with coherence
-        if self._coherence_level == CoherenceLevel.CHAOTIC:
+        if self._coherence_level is CoherenceLevel.CHAOTIC:
             # Gusty, unpredictable
             gust = math.sin(self._wind_time * 2.0) * 0.3
-            self._wind_strength = cfg.base_wind_strength + gust
+            strength = cfg.base_wind_strength + gust
         else:
-            self._wind_strength = cfg.base_wind_strength
+            strength = cfg.base_wind_strength
         
-        self._wind_strength = max(0.0, min(1.0, self._wind_strength))
+        # Clamp to [0, 1] (same result as max(0.0, min(1.0, ...)))
+        self._wind_strength = (
+            (strength if strength > 0.0 else 0.0) if strength < 1.0 else 1.0
+        )
     
-    def _update_category(self, state: CategoryState, delta_time: float) -> None:
-        """Update a motion category."""
-        cfg = self.config
+    def _update_category(self, state: CategoryState, delta_time: float,
+                         level_params: Tuple[float, float, float, float]) -> int:
+        """
+        Update a motion category.
         
-        # Get coherence parameters
-        phase_var = cfg.phase_variance.get(self._coherence_level, 0.3)
-        speed_var = cfg.speed_variance.get(self._coherence_level, 0.1)
-        dir_var = cfg.direction_variance.get(self._coherence_level, 15.0)
-        settling = cfg.settling_rate.get(self._coherence_level, 0.9)
+        level_params is the current level's (phase_var, dir_var, speed_var,
+        settling) row from the baked level table.
+        
+        Returns:
+            Number of elements in the category that are now settled
+        """
+        phase_var, dir_var, speed_var, settling = level_params
         
         # Update category-level parameters
         state.phase_coherence = self._coherence_value
@@ -426,79 +518,113 @@ class MotionManager:
         
         state.animation_speed_variance = speed_var
         
-        # Update each element
-        for element in state.elements.values():
-            self._update_element(element, state, phase_var, speed_var, 
-                                dir_var, settling, delta_time)
-    
-    def _update_element(self, element: ElementMotionState, state: CategoryState,
-                        phase_var: float, speed_var: float, dir_var: float,
-                        settling: float, delta_time: float) -> None:
-        """Update a single element's motion state."""
-        # Phase offset varies with coherence
-        target_offset = (self._rng.random() - 0.5) * phase_var * 2
-        element.phase_offset += (target_offset - element.phase_offset) * delta_time * 0.5
-        element.current_phase = element.base_phase + element.phase_offset
-        
-        # Speed varies with coherence
-        target_speed_mult = 1.0 + (self._rng.random() - 0.5) * speed_var * 2
-        element.speed_multiplier += (target_speed_mult - element.speed_multiplier) * delta_time * 0.5
-        element.current_speed = element.base_speed * element.speed_multiplier
-        
-        # Local wind direction
-        dir_offset = (self._rng.random() - 0.5) * dir_var * 2
-        element.local_wind_direction = (state.wind_direction + dir_offset) % 360
-        element.local_wind_strength = state.wind_strength * (0.8 + self._rng.random() * 0.4)
-        
-        # Settling behavior
-        if state.can_settle and state.wind_strength < state.settling_threshold:
-            element.settling_progress += settling * delta_time
-            element.settling_progress = min(1.0, element.settling_progress)
-            element.is_settled = element.settling_progress > 0.9
+        # Category-level values above are still reported for empty
+        # categories; only the element setup below is skipped
+        elements = state.elements
+        if not elements:
+            return 0
+        
+        # Update each element. The per-element step is fused into this loop
+        # with the RNG and category values bound to locals, so a frame costs
+        # one pass over the elements and no per-element method calls.
+        random = self._rng.random
+        wind_direction = state.wind_direction
+        wind_strength = state.wind_strength
+        settling_active = state.can_settle and wind_strength < state.settling_threshold
+        props = MotionCategory.PROPS
+        
+        # Loop invariants, hoisted so the element body is plain arithmetic.
+        # Scaling by 2 and 0.5 is exact, so the hoisted products round the
+        # same as the original per-element expressions.
+        phase_span = phase_var * 2
+        speed_span = speed_var * 2
+        dir_span = dir_var * 2
+        blend = delta_time * 0.5
+        settle_step = settling * delta_time
+        # Residual motion based on coherence (chaotic = never still)
+        residual = (1.0 - settling) * 0.1
+        incoherence = 1.0 - self._coherence_value
+        jitter_amount = incoherence * 0.02
+        jitter_frequency = 5.0 + incoherence * 10.0
+        settled = 0
+        
+        for element in elements.values():
+            # Phase offset varies with coherence
+            target_offset = (random() - 0.5) * phase_span
+            phase_offset = element.phase_offset
+            phase_offset += (target_offset - phase_offset) * blend
+            element.phase_offset = phase_offset
+            element.current_phase = element.base_phase + phase_offset
             
-            # Residual motion based on coherence (chaotic = never still)
-            element.residual_motion = (1.0 - settling) * 0.1
-        else:
-            element.settling_progress = 0.0
-            element.is_settled = False
-            element.residual_motion = 0.0
-        
-        # Jitter for props
-        if element.category == MotionCategory.PROPS:
-            element.jitter_amount = (1.0 - self._coherence_value) * 0.02
-            element.jitter_frequency = 5.0 + (1.0 - self._coherence_value) * 10.0
-    
-    def _create_snapshot(self) -> MotionSnapshot:
-        """Create a snapshot of current motion state."""
-        snapshot = MotionSnapshot()
+            # Speed varies with coherence
+            target_speed_mult = 1.0 + (random() - 0.5) * speed_span
+            speed_mult = element.speed_multiplier
+            speed_mult += (target_speed_mult - speed_mult) * blend
+            element.speed_multiplier = speed_mult
+            element.current_speed = element.base_speed * speed_mult
+            
+            # Local wind direction
+            dir_offset = (random() - 0.5) * dir_span
+            element.local_wind_direction = (wind_direction + dir_offset) % 360
+            element.local_wind_strength = wind_strength * (0.8 + random() * 0.4)
+            
+            # Settling behavior
+            if settling_active:
+                progress = element.settling_progress + settle_step
+                if not progress < 1.0:
+                    progress = 1.0
+                element.settling_progress = progress
+                is_settled = progress > 0.9
+                element.is_settled = is_settled
+                element.residual_motion = residual
+                if is_settled:
+                    settled += 1
+            else:
+                element.settling_progress = 0.0
+                element.is_settled = False
+                element.residual_motion = 0.0
+            
+            # Jitter for props
+            if element.category is props:
+                element.jitter_amount = jitter_amount
+                element.jitter_frequency = jitter_frequency
+        
+        return settled
+    
+    def _create_snapshot(self, settled_elements: int) -> MotionSnapshot:
+        """
+        Create a snapshot of current motion state.
+        
+        settled_elements is the settled count gathered during the update.
+        """
+        snapshot = self._snapshot
+        if snapshot is None:
+            snapshot = MotionSnapshot()
+            snapshot.category_states = dict(self.categories)
         snapshot.population = self._population
         snapshot.coherence_level = self._coherence_level
         snapshot.coherence_value = self._coherence_value
         snapshot.global_wind_direction = self._wind_direction
         snapshot.global_wind_strength = self._wind_strength
-        snapshot.category_states = dict(self.categories)
         
         # Calculate aggregates
         total_phase_coherence = 0.0
         total_speed_coherence = 0.0
         total_elements = 0
-        settled_elements = 0
         
-        for state in self.categories.values():
+        category_states = self._category_states
+        for state in category_states:
             total_phase_coherence += state.phase_coherence
             total_speed_coherence += state.speed_coherence
-            
-            for element in state.elements.values():
-                total_elements += 1
-                if element.is_settled:
-                    settled_elements += 1
+            total_elements += len(state.elements)
         
-        if len(self.categories) > 0:
-            snapshot.average_phase_coherence = total_phase_coherence / len(self.categories)
-            snapshot.average_speed_coherence = total_speed_coherence / len(self.categories)
+        if category_states:
+            snapshot.average_phase_coherence = total_phase_coherence / len(category_states)
+            snapshot.average_speed_coherence = total_speed_coherence / len(category_states)
         
-        if total_elements > 0:
-            snapshot.settling_elements_ratio = settled_elements / total_elements
+        snapshot.settling_elements_ratio = (
+            settled_elements / total_elements if total_elements > 0 else 0.0
+        )
         
         return snapshot
     
@@ -517,7 +643,7 @@ class MotionManager:
         self._wind_direction = self.config.base_wind_direction
         self._wind_strength = self.config.base_wind_strength
         
-        for state in self.categories.values():
+        for state in self._category_states:
             state.phase_coherence = 1.0
             state.speed_coherence = 1.0
             state.direction_coherence = 1.0
@@ -552,7 +678,7 @@ class MotionManager:
 # UE5 Parameters
 # =============================================================================
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class FMotionParameters:
     """UE5-ready motion coherence parameters."""
     
@@ -602,111 +728,159 @@ class FMotionParameters:
     
     def to_ue5_json(self) -> Dict[str, Any]:
         """Export as JSON for UE5."""
-        return {
-            'Motion_CoherenceLevel': self.coherence_level,
-            'Motion_CoherenceValue': self.coherence_value,
-            'Wind_Direction': self.wind_direction,
-            'Wind_Strength': self.wind_strength,
-            'Wind_DirectionVariance': self.wind_direction_variance,
-            'Wind_Gusting': self.wind_gusting,
-            'Foliage_PhaseOffsetMax': self.foliage_phase_offset_max,
-            'Foliage_SpeedVariance': self.foliage_speed_variance,
-            'Foliage_WaveCoherence': self.foliage_wave_coherence,
-            'Foliage_Turbulence': self.foliage_turbulence,
-            'Cloth_PhaseOffsetMax': self.cloth_phase_offset_max,
-            'Cloth_SpeedVariance': self.cloth_speed_variance,
-            'Cloth_SettlingRate': self.cloth_settling_rate,
-            'Cloth_ResidualMotion': self.cloth_residual_motion,
-            'Cloth_Damping': self.cloth_damping,
-            'Prop_JitterAmount': self.prop_jitter_amount,
-            'Prop_JitterFrequency': self.prop_jitter_frequency,
-            'Prop_SwayCoherence': self.prop_sway_coherence,
-            'Prop_MicroMovement': self.prop_micro_movement,
-            'Water_WaveCoherence': self.water_wave_coherence,
-            'Water_RippleVariance': self.water_ripple_variance,
-            'Water_Turbulence': self.water_turbulence,
-            'Particle_DirectionVariance': self.particle_direction_variance,
-            'Particle_SpeedVariance': self.particle_speed_variance,
-            'Particle_Coherence': self.particle_coherence,
-            'NPC_IdlePhaseVariance': self.npc_idle_phase_variance,
-            'NPC_IdleSpeedVariance': self.npc_idle_speed_variance,
-            'NPC_BreathingSync': self.npc_breathing_sync,
-        }
+        return dict(zip(_MOTION_UE5_KEYS, _motion_ue5_values(self)))
+    
+    def to_json_string(self, indent: int = None) -> str:
+        """Serialize to JSON string."""
+        return ue5_json_string(self.to_ue5_json(), indent)
     
     @classmethod
     def from_manager(cls, manager: MotionManager) -> 'FMotionParameters':
         """Create parameters from motion manager state."""
-        params = cls()
-        cfg = manager.config
-        
-        params.coherence_level = manager.coherence_level.value
-        params.coherence_value = manager.coherence_value
-        
-        # Wind
-        params.wind_direction = manager._wind_direction
-        params.wind_strength = manager._wind_strength
-        params.wind_direction_variance = cfg.direction_variance.get(
-            manager.coherence_level, 15.0
+        level = manager.coherence_level
+        level_idx = _LEVEL_INDEX[level]
+        phase_var, dir_var, speed_var, settling = manager._level_params[level_idx]
+        
+        # Shared subexpressions, computed once
+        coherence = manager.coherence_value
+        incoherence = 1.0 - coherence
+        unsettled = 1.0 - settling
+        
+        return cls(
+            coherence_level=_LEVEL_KEYS[level],
+            coherence_value=coherence,
+            # Wind
+            wind_direction=manager._wind_direction,
+            wind_strength=manager._wind_strength,
+            wind_direction_variance=dir_var,
+            wind_gusting=_WIND_GUSTING[level_idx],
+            # Foliage
+            foliage_phase_offset_max=phase_var,
+            foliage_speed_variance=speed_var,
+            foliage_wave_coherence=coherence,
+            foliage_turbulence=incoherence,
+            # Cloth
+            cloth_phase_offset_max=phase_var,
+            cloth_speed_variance=speed_var,
+            cloth_settling_rate=settling,
+            cloth_residual_motion=unsettled * 0.1,
+            cloth_damping=0.5 + coherence * 0.5,
+            # Props
+            prop_jitter_amount=incoherence * 0.02,
+            prop_jitter_frequency=5.0 + incoherence * 10.0,
+            prop_sway_coherence=coherence,
+            prop_micro_movement=unsettled * 0.05,
+            # Water
+            water_wave_coherence=coherence,
+            water_ripple_variance=incoherence * 0.5,
+            water_turbulence=incoherence * 0.3,
+            # Particles
+            particle_direction_variance=dir_var,
+            particle_speed_variance=speed_var,
+            particle_coherence=coherence,
+            # NPCs
+            npc_idle_phase_variance=phase_var * 0.5,
+            npc_idle_speed_variance=speed_var * 0.5,
+            npc_breathing_sync=_NPC_BREATHING_SYNC[level_idx],
         )
-        params.wind_gusting = 0.0 if manager.coherence_level != CoherenceLevel.CHAOTIC else 0.5
-        
-        # Get variance values
-        phase_var = cfg.phase_variance.get(manager.coherence_level, 0.3)
-        speed_var = cfg.speed_variance.get(manager.coherence_level, 0.1)
-        settling = cfg.settling_rate.get(manager.coherence_level, 0.9)
-        
-        # Foliage
-        params.foliage_phase_offset_max = phase_var
-        params.foliage_speed_variance = speed_var
-        params.foliage_wave_coherence = manager.coherence_value
-        params.foliage_turbulence = 1.0 - manager.coherence_value
-        
-        # Cloth
-        params.cloth_phase_offset_max = phase_var
-        params.cloth_speed_variance = speed_var
-        params.cloth_settling_rate = settling
-        params.cloth_residual_motion = (1.0 - settling) * 0.1
-        params.cloth_damping = 0.5 + manager.coherence_value * 0.5
-        
-        # Props
-        params.prop_jitter_amount = (1.0 - manager.coherence_value) * 0.02
-        params.prop_jitter_frequency = 5.0 + (1.0 - manager.coherence_value) * 10.0
-        params.prop_sway_coherence = manager.coherence_value
-        params.prop_micro_movement = (1.0 - settling) * 0.05
-        
-        # Water
-        params.water_wave_coherence = manager.coherence_value
-        params.water_ripple_variance = (1.0 - manager.coherence_value) * 0.5
-        params.water_turbulence = (1.0 - manager.coherence_value) * 0.3
-        
-        # Particles
-        params.particle_direction_variance = cfg.direction_variance.get(
-            manager.coherence_level, 15.0
-        )
-        params.particle_speed_variance = speed_var
-        params.particle_coherence = manager.coherence_value
-        
-        # NPCs
-        params.npc_idle_phase_variance = phase_var * 0.5
-        params.npc_idle_speed_variance = speed_var * 0.5
-        # Breathing sync: too perfect sync is eerie, too much variance is chaotic
-        # Optimal is NATURAL level
-        if manager.coherence_level == CoherenceLevel.UNIFIED:
-            params.npc_breathing_sync = 0.95  # Almost too perfect
-        elif manager.coherence_level == CoherenceLevel.NATURAL:
-            params.npc_breathing_sync = 0.7   # Natural variation
-        elif manager.coherence_level == CoherenceLevel.VARIED:
-            params.npc_breathing_sync = 0.4
-        else:
-            params.npc_breathing_sync = 0.1   # Very desynchronized
-        
-        return params
+
+
+# UE5 key -> FMotionParameters field, in export order
+_MOTION_UE5_FIELDS: Tuple[Tuple[str, str], ...] = (
+    ('Motion_CoherenceLevel', 'coherence_level'),
+    ('Motion_CoherenceValue', 'coherence_value'),
+    ('Wind_Direction', 'wind_direction'),
+    ('Wind_Strength', 'wind_strength'),
+    ('Wind_DirectionVariance', 'wind_direction_variance'),
+    ('Wind_Gusting', 'wind_gusting'),
+    ('Foliage_PhaseOffsetMax', 'foliage_phase_offset_max'),
+    ('Foliage_SpeedVariance', 'foliage_speed_variance'),
+    ('Foliage_WaveCoherence', 'foliage_wave_coherence'),
+    ('Foliage_Turbulence', 'foliage_turbulence'),
+    ('Cloth_PhaseOffsetMax', 'cloth_phase_offset_max'),
+    ('Cloth_SpeedVariance', 'cloth_speed_variance'),
+    ('Cloth_SettlingRate', 'cloth_settling_rate'),
+    ('Cloth_ResidualMotion', 'cloth_residual_motion'),
+    ('Cloth_Damping', 'cloth_damping'),
+    ('Prop_JitterAmount', 'prop_jitter_amount'),
+    ('Prop_JitterFrequency', 'prop_jitter_frequency'),
+    ('Prop_SwayCoherence', 'prop_sway_coherence'),
+    ('Prop_MicroMovement', 'prop_micro_movement'),
+    ('Water_WaveCoherence', 'water_wave_coherence'),
+    ('Water_RippleVariance', 'water_ripple_variance'),
+    ('Water_Turbulence', 'water_turbulence'),
+    ('Particle_DirectionVariance', 'particle_direction_variance'),
+    ('Particle_SpeedVariance', 'particle_speed_variance'),
+    ('Particle_Coherence', 'particle_coherence'),
+    ('NPC_IdlePhaseVariance', 'npc_idle_phase_variance'),
+    ('NPC_IdleSpeedVariance', 'npc_idle_speed_variance'),
+    ('NPC_BreathingSync', 'npc_breathing_sync'),
+)
+_MOTION_UE5_KEYS: Tuple[str, ...] = tuple(k for k, _ in _MOTION_UE5_FIELDS)
+_motion_ue5_values = attrgetter(*(f for _, f in _MOTION_UE5_FIELDS))
+
+# Per-level values (by _LEVEL_INDEX) for FMotionParameters.from_manager.
+# Wind only gusts when CHAOTIC.
+_WIND_GUSTING: Tuple[float, ...] = (0.0, 0.0, 0.0, 0.5)
+# Breathing sync: too perfect sync is eerie, too much variance is chaotic;
+# optimal is NATURAL. UNIFIED is almost too perfect, CHAOTIC very
+# desynchronized.
+_NPC_BREATHING_SYNC: Tuple[float, ...] = (0.95, 0.7, 0.4, 0.1)
 
 
 # =============================================================================
 # Wind Pattern Generator
 # =============================================================================
 
+def _wind_calm(time: float, base_direction: float,
+               base_strength: float) -> Tuple[float, float]:
+    """CALM pattern: fixed direction, minimal strength."""
+    return base_direction, 0.1
+
+
+def _wind_steady(time: float, base_direction: float,
+                 base_strength: float) -> Tuple[float, float]:
+    """STEADY pattern: minimal variation."""
+    dir_var = math.sin(time * 0.05) * 5.0
+    str_var = math.sin(time * 0.1) * 0.05
+    return (
+        (base_direction + dir_var) % 360,
+        max(0.1, min(1.0, base_strength + str_var))
+    )
+
+
+def _wind_gusting(time: float, base_direction: float,
+                  base_strength: float) -> Tuple[float, float]:
+    """GUSTING pattern: periodic strong gusts."""
+    gust_cycle = math.sin(time * 0.3)
+    gust = max(0, gust_cycle) ** 2 * 0.4
+    dir_var = math.sin(time * 0.2) * 20.0
+    return (
+        (base_direction + dir_var) % 360,
+        max(0.1, min(1.0, base_strength + gust))
+    )
+
+
+def _wind_swirling(time: float, base_direction: float,
+                   base_strength: float) -> Tuple[float, float]:
+    """SWIRLING pattern: chaotic direction changes."""
+    dir_var = math.sin(time * 0.5) * 60.0 + math.sin(time * 1.3) * 30.0
+    str_var = math.sin(time * 0.7) * 0.2
+    return (
+        (base_direction + dir_var) % 360,
+        max(0.1, min(1.0, base_strength + str_var))
+    )
+
+
+# Wind function per pattern, resolved once in set_pattern
+_WIND_PATTERN_FUNCS: Dict[WindPattern, Callable[[float, float, float], Tuple[float, float]]] = {
+    WindPattern.CALM: _wind_calm,
+    WindPattern.STEADY: _wind_steady,
+    WindPattern.GUSTING: _wind_gusting,
+    WindPattern.SWIRLING: _wind_swirling,
+}
+
+
 class WindPatternGenerator:
     """
     Generates wind patterns for environmental motion.
@@ -720,11 +894,12 @@ class WindPatternGenerator:
         self.base_direction = base_direction
         self.base_strength = base_strength
         self._time = 0.0
-        self._pattern = WindPattern.STEADY
+        self.set_pattern(WindPattern.STEADY)
     
     def set_pattern(self, pattern: WindPattern) -> None:
         """Set wind pattern."""
         self._pattern = pattern
+        self._wind_fn = _WIND_PATTERN_FUNCS[pattern]
     
     def update(self, delta_time: float, coherence: float) -> Tuple[float, float]:
         """
@@ -734,45 +909,16 @@ class WindPatternGenerator:
             Tuple of (direction_degrees, strength_0_to_1)
         """
         self._time += delta_time
-        
-        if self._pattern == WindPattern.CALM:
-            return self.base_direction, 0.1
-        
-        elif self._pattern == WindPattern.STEADY:
-            # Minimal variation
-            dir_var = math.sin(self._time * 0.05) * 5.0
-            str_var = math.sin(self._time * 0.1) * 0.05
-            return (
-                (self.base_direction + dir_var) % 360,
-                max(0.1, min(1.0, self.base_strength + str_var))
-            )
-        
-        elif self._pattern == WindPattern.GUSTING:
-            # Periodic strong gusts
-            gust_cycle = math.sin(self._time * 0.3)
-            gust = max(0, gust_cycle) ** 2 * 0.4
-            dir_var = math.sin(self._time * 0.2) * 20.0
-            return (
-                (self.base_direction + dir_var) % 360,
-                max(0.1, min(1.0, self.base_strength + gust))
-            )
-        
-        else:  # SWIRLING
-            # Chaotic direction changes
-            dir_var = math.sin(self._time * 0.5) * 60.0 + math.sin(self._time * 1.3) * 30.0
-            str_var = math.sin(self._time * 0.7) * 0.2
-            return (
-                (self.base_direction + dir_var) % 360,
-                max(0.1, min(1.0, self.base_strength + str_var))
-            )
+        # Pattern dispatch happens once in set_pattern, not per call
+        return self._wind_fn(self._time, self.base_direction, self.base_strength)
     
     def get_pattern_for_coherence(self, coherence_level: CoherenceLevel) -> WindPattern:
         """Get appropriate wind pattern for coherence level."""
-        if coherence_level == CoherenceLevel.UNIFIED:
+        if coherence_level is CoherenceLevel.UNIFIED:
             return WindPattern.CALM
-        elif coherence_level == CoherenceLevel.NATURAL:
+        elif coherence_level is CoherenceLevel.NATURAL:
             return WindPattern.STEADY
-        elif coherence_level == CoherenceLevel.VARIED:
+        elif coherence_level is CoherenceLevel.VARIED:
             return WindPattern.GUSTING
         else:
             return WindPattern.SWIRLING
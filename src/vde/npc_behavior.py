@@ -19,6 +19,7 @@ make players uncomfortable without any explicit messaging.
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Any, Set, Tuple
 from enum import Enum, Flag, auto
+from bisect import bisect_right
 import math
 import random
 
@@ -89,6 +90,37 @@ class IdleBehavior(Flag):
            ARGUE | EAT | SMOKE | READ | SLEEP | WORK | PATROL | BROWSE | PLAY)
 
 
+# Single-bit idle behaviors in declaration order (excludes NONE and ALL)
+_SINGLE_BEHAVIORS: Tuple[IdleBehavior, ...] = tuple(
+    behavior for behavior in IdleBehavior.__members__.values()
+    if behavior.value and not behavior.value & (behavior.value - 1)
+)
+
+# Decomposed behaviors per idle mask, filled on first use of each mask
+_BEHAVIOR_CHOICES: Dict[int, Tuple[IdleBehavior, ...]] = {}
+
+
+def _decompose_behaviors(mask: int) -> Tuple[IdleBehavior, ...]:
+    """Get the single-bit behaviors set in an idle mask (cached per mask)."""
+    behaviors = _BEHAVIOR_CHOICES.get(mask)
+    if behaviors is None:
+        behaviors = tuple(b for b in _SINGLE_BEHAVIORS if b.value & mask)
+        _BEHAVIOR_CHOICES[mask] = behaviors
+    return behaviors
+
+
+# Comfort levels by index, from RELAXED (0) to OVERWHELMED (4)
+_COMFORT_LEVELS: Tuple[ComfortLevel, ...] = tuple(ComfortLevel)
+_COMFORT_INDEX: Dict[ComfortLevel, int] = {
+    level: idx for idx, level in enumerate(_COMFORT_LEVELS)
+}
+
+# Smoothed comfort target per level index, from 1.0 (relaxed) to 0.0 (overwhelmed)
+_COMFORT_TARGETS: Tuple[float, ...] = tuple(
+    1.0 - (idx / (len(_COMFORT_LEVELS) - 1)) for idx in range(len(_COMFORT_LEVELS))
+)
+
+
 class RepositionReason(Enum):
     """Why an NPC is repositioning."""
     NONE = "none"
@@ -106,7 +138,14 @@ class RepositionReason(Enum):
 
 @dataclass
 class NPCBehaviorProfile:
-    """Behavior profile for an NPC type."""
+    """
+    Behavior profile for an NPC type.
+    
+    idle_behaviors is flattened at construction into per-level idle masks
+    and decomposed behavior tuples, indexed by comfort level (missing levels
+    fall back to STAND). Build a new profile rather than mutating
+    idle_behaviors in place.
+    """
     npc_type: NPCType
     
     # Idle behaviors available at each comfort level
@@ -127,6 +166,20 @@ class NPCBehaviorProfile:
     # Work-related settings
     has_station: bool = False  # Tied to a specific location
     station_radius: float = 100.0  # How far they'll move from station
+    
+    # Flattened idle_behaviors, indexed by comfort level
+    _idle_masks: Tuple[int, ...] = field(init=False, repr=False, compare=False)
+    _idle_choices: Tuple[Tuple[IdleBehavior, ...], ...] = field(
+        init=False, repr=False, compare=False
+    )
+    
+    def __post_init__(self):
+        masks = tuple(
+            self.idle_behaviors.get(level, IdleBehavior.STAND).value
+            for level in _COMFORT_LEVELS
+        )
+        self._idle_masks = masks
+        self._idle_choices = tuple(_decompose_behaviors(mask) for mask in masks)
 
 
 # Default profiles per NPC type
@@ -358,7 +411,13 @@ DEFAULT_PROFILES: Dict[NPCType, NPCBehaviorProfile] = {
 
 @dataclass
 class NPCConfig:
-    """Configuration for NPC modulation system."""
+    """
+    Configuration for NPC modulation system.
+    
+    NPCManager bakes the comfort thresholds into a lookup table when it is
+    constructed; call NPCManager.set_config() after changing them on a
+    config that a manager is already using.
+    """
     
     # Population thresholds for comfort levels
     relaxed_max_pop: float = 0.20
@@ -492,6 +551,28 @@ class NPCManager:
         
         # Random seed for deterministic behavior selection
         self._rng = random.Random(42)
+        
+        self._bake_config()
+    
+    def set_config(self, config: NPCConfig) -> None:
+        """Replace the NPC configuration and re-derive the threshold table."""
+        self.config = config
+        self._bake_config()
+    
+    def _bake_config(self) -> None:
+        """Flatten the comfort thresholds into a bisectable table."""
+        cfg = self.config
+        # Running maximum of the thresholds: the first level whose threshold
+        # exceeds the population is the first whose running max does, so
+        # bisect_right matches the ordered threshold checks for any config
+        thresholds = []
+        running_max = -math.inf
+        for threshold in (cfg.relaxed_max_pop, cfg.comfortable_max_pop,
+                          cfg.uneasy_max_pop, cfg.stressed_max_pop):
+            if threshold > running_max:
+                running_max = threshold
+            thresholds.append(running_max)
+        self._comfort_thresholds: List[float] = thresholds
     
     def register_npc(self, npc_id: str, npc_type: NPCType,
                      custom_profile: Optional[NPCBehaviorProfile] = None) -> None:
@@ -529,46 +610,61 @@ class NPCManager:
         # Determine global comfort from population
         self._global_comfort = self._get_comfort_level(self._population)
         
+        # Per-tick invariants shared by every NPC
+        blend = min(1.0, delta_time * self.config.comfort_smoothing * 10)
+        population = self._population
+        get_comfort_index = self._get_comfort_index
+        update_npc = self._update_npc
+        
+        # An NPC's comfort depends only on population * crowd_sensitivity,
+        # so NPCs sharing a sensitivity share one threshold lookup per tick
+        comfort_by_sensitivity: Dict[float, int] = {}
+        
         # Update each NPC
         for npc in self.npcs.values():
-            self._update_npc(npc, delta_time)
+            sensitivity = npc.profile.crowd_sensitivity
+            comfort_idx = comfort_by_sensitivity.get(sensitivity)
+            if comfort_idx is None:
+                comfort_idx = get_comfort_index(population * sensitivity)
+                comfort_by_sensitivity[sensitivity] = comfort_idx
+            update_npc(npc, delta_time, comfort_idx, blend)
         
         return self._create_snapshot()
     
     def _get_comfort_level(self, population: float) -> ComfortLevel:
         """Determine comfort level from population."""
-        cfg = self.config
+        return _COMFORT_LEVELS[self._get_comfort_index(population)]
+    
+    def _get_comfort_index(self, population: float) -> int:
+        """Determine comfort level index (0 = RELAXED) from population."""
+        return bisect_right(self._comfort_thresholds, population)
+    
+    def _update_npc(self, npc: NPCState, delta_time: float,
+                    comfort_idx: int, blend: float) -> None:
+        """
+        Update a single NPC's state.
         
-        if population < cfg.relaxed_max_pop:
-            return ComfortLevel.RELAXED
-        elif population < cfg.comfortable_max_pop:
-            return ComfortLevel.COMFORTABLE
-        elif population < cfg.uneasy_max_pop:
-            return ComfortLevel.UNEASY
-        elif population < cfg.stressed_max_pop:
-            return ComfortLevel.STRESSED
-        else:
-            return ComfortLevel.OVERWHELMED
-    
-    def _update_npc(self, npc: NPCState, delta_time: float) -> None:
-        """Update a single NPC's state."""
+        Args:
+            npc: NPC to update
+            delta_time: Time since last update in seconds
+            comfort_idx: Comfort level index for this NPC's crowd sensitivity
+            blend: Comfort smoothing factor for this tick
+        """
         cfg = self.config
         profile = npc.profile
         
-        # Calculate NPC-specific comfort (affected by sensitivity)
-        adjusted_pop = self._population * profile.crowd_sensitivity
-        npc_comfort_level = self._get_comfort_level(adjusted_pop)
+        npc_comfort_level = _COMFORT_LEVELS[comfort_idx]
         
         # Smooth comfort value
-        comfort_idx = self.COMFORT_ORDER.index(npc_comfort_level)
-        npc.target_comfort = 1.0 - (comfort_idx / (len(self.COMFORT_ORDER) - 1))
+        npc.target_comfort = _COMFORT_TARGETS[comfort_idx]
         
-        diff = npc.target_comfort - npc.comfort_value
-        npc.comfort_value += diff * min(1.0, delta_time * cfg.comfort_smoothing * 10)
+        comfort_value = npc.comfort_value
+        comfort_value += (npc.target_comfort - comfort_value) * blend
+        npc.comfort_value = comfort_value
         npc.comfort_level = npc_comfort_level
         
         # Handle NPCs that can leave
-        if profile.can_leave and npc_comfort_level == ComfortLevel.OVERWHELMED:
+        if profile.can_leave and npc_comfort_level is ComfortLevel.OVERWHELMED:
             behaviors = profile.idle_behaviors.get(ComfortLevel.OVERWHELMED, IdleBehavior.NONE)
             if behaviors == IdleBehavior.NONE:
                 npc.is_active = False
@@ -578,79 +674,53 @@ class NPCManager:
         
         # Update edge preference
         base_edge = profile.edge_preference_base
-        comfort_edge = (1.0 - npc.comfort_value) * cfg.edge_preference_max
-        npc.edge_preference = min(1.0, base_edge + comfort_edge)
+        comfort_edge = (1.0 - comfort_value) * cfg.edge_preference_max
+        edge_preference = min(1.0, base_edge + comfort_edge)
+        npc.edge_preference = edge_preference
         
         # Update interaction radius
-        radius_mult = cfg.interaction_radius_min + npc.comfort_value * (1.0 - cfg.interaction_radius_min)
+        radius_mult = cfg.interaction_radius_min + comfort_value * (1.0 - cfg.interaction_radius_min)
         npc.interaction_radius = profile.base_interaction_radius * radius_mult
         
-        # Update repositioning
-        self._update_repositioning(npc, delta_time)
-        
-        # Update idle behavior
-        self._update_idle_behavior(npc, delta_time)
-        
-        # Update activity level
-        npc.activity_level = 0.5 + npc.comfort_value * 0.5
-    
-    def _update_repositioning(self, npc: NPCState, delta_time: float) -> None:
-        """Update NPC repositioning state."""
-        cfg = self.config
-        
+        # Update repositioning (interval shrinks as comfort drops)
         npc.time_since_reposition += delta_time
-        
-        # Calculate reposition interval based on comfort
-        comfort_factor = npc.comfort_value
         npc.reposition_interval = (
             cfg.min_reposition_interval + 
-            comfort_factor * (cfg.base_reposition_interval - cfg.min_reposition_interval)
+            comfort_value * (cfg.base_reposition_interval - cfg.min_reposition_interval)
         )
         
-        # Check if NPC wants to reposition
         if npc.time_since_reposition >= npc.reposition_interval:
             npc.wants_to_reposition = True
             
             # Determine reason
-            if npc.comfort_level in [ComfortLevel.STRESSED, ComfortLevel.OVERWHELMED]:
+            if npc_comfort_level is ComfortLevel.STRESSED or npc_comfort_level is ComfortLevel.OVERWHELMED:
                 npc.reposition_reason = RepositionReason.CROWDING
-            elif npc.edge_preference > 0.5:
+            elif edge_preference > 0.5:
                 npc.reposition_reason = RepositionReason.EDGE_SEEKING
-            elif npc.comfort_level == ComfortLevel.RELAXED and self._rng.random() < cfg.social_cluster_chance:
+            elif npc_comfort_level is ComfortLevel.RELAXED and self._rng.random() < cfg.social_cluster_chance:
                 npc.reposition_reason = RepositionReason.SOCIAL
             else:
                 npc.reposition_reason = RepositionReason.COMFORT
-    
-    def _update_idle_behavior(self, npc: NPCState, delta_time: float) -> None:
-        """Update NPC idle behavior."""
-        profile = npc.profile
         
+        # Update idle behavior
         npc.idle_duration += delta_time
         
-        # Check if we need a new behavior
         if npc.idle_duration >= npc.idle_target_duration:
-            # Get available behaviors for current comfort
-            available = profile.idle_behaviors.get(npc.comfort_level, IdleBehavior.STAND)
-            
-            # Select a random behavior from available
-            npc.current_idle = self._select_random_behavior(available)
+            # Select a random behavior from those available at this comfort
+            behaviors = profile._idle_choices[comfort_idx]
+            npc.current_idle = self._rng.choice(behaviors) if behaviors else IdleBehavior.STAND
             npc.idle_duration = 0.0
             
             # Random duration based on comfort
-            base_duration = 5.0 + npc.comfort_value * 10.0
+            base_duration = 5.0 + comfort_value * 10.0
             npc.idle_target_duration = base_duration * (0.5 + self._rng.random())
+        
+        # Update activity level
+        npc.activity_level = 0.5 + comfort_value * 0.5
     
     def _select_random_behavior(self, available: IdleBehavior) -> IdleBehavior:
         """Select a random behavior from available flags."""
-        if available == IdleBehavior.NONE:
-            return IdleBehavior.STAND
-        
-        # Get individual behaviors
-        behaviors = []
-        for behavior in IdleBehavior:
-            if behavior != IdleBehavior.NONE and behavior != IdleBehavior.ALL:
-                if behavior in available:
-                    behaviors.append(behavior)
+        behaviors = _decompose_behaviors(available.value)
         
         if not behaviors:
             return IdleBehavior.STAND
@@ -705,9 +775,9 @@ class NPCManager:
                     'comfort_level': npc.comfort_level.value,
                     'comfort_value': npc.comfort_value,
                     'current_idle': npc.current_idle.name if npc.current_idle else 'STAND',
-                    'idle_behaviors_mask': npc.profile.idle_behaviors.get(
-                        npc.comfort_level, IdleBehavior.STAND
-                    ).value,
+                    'idle_behaviors_mask': npc.profile._idle_masks[
+                        _COMFORT_INDEX[npc.comfort_level]
+                    ],
                     'edge_preference': npc.edge_preference,
                     'interaction_radius': npc.interaction_radius,
                     'activity_level': npc.activity_level,
@@ -839,6 +909,14 @@ class FNPCBehaviorCommand:
         }
 
 
+# Default command fields (after NPCID/NPCType/IsActive) for inactive NPCs
+_INACTIVE_UE5_COMMAND: Dict[str, Any] = {
+    key: value
+    for key, value in FNPCBehaviorCommand('', '', False).to_ue5_json().items()
+    if key not in ('NPCID', 'NPCType', 'IsActive')
+}
+
+
 class NPCCommandGenerator:
     """
     Generates UE5 behavior commands from NPC manager state.
@@ -859,9 +937,9 @@ class NPCCommandGenerator:
                 cmd.comfort_level = npc.comfort_level.value
                 cmd.comfort_value = npc.comfort_value
                 cmd.current_idle = npc.current_idle.name if npc.current_idle else "STAND"
-                cmd.idle_behaviors_mask = npc.profile.idle_behaviors.get(
-                    npc.comfort_level, IdleBehavior.STAND
-                ).value
+                cmd.idle_behaviors_mask = npc.profile._idle_masks[
+                    _COMFORT_INDEX[npc.comfort_level]
+                ]
                 cmd.edge_preference = npc.edge_preference
                 cmd.interaction_radius = npc.interaction_radius
                 cmd.wants_reposition = npc.wants_to_reposition
@@ -875,16 +953,59 @@ class NPCCommandGenerator:
         return commands
     
     def to_ue5_json(self, manager: NPCManager) -> Dict[str, Any]:
-        """Generate complete UE5 JSON payload."""
-        commands = self.generate_commands(manager)
+        """
+        Generate complete UE5 JSON payload.
+        
+        Command dicts are built in a single pass over the NPCs, with the same
+        keys and values as generate_commands() + FNPCBehaviorCommand.to_ue5_json().
+        """
+        npc_commands = []
+        append = npc_commands.append
+        active_count = 0
+        repositioning_count = 0
+        
+        for npc_id, npc in manager.npcs.items():
+            if npc.wants_to_reposition:
+                repositioning_count += 1
+            
+            if not npc.is_active:
+                cmd = {
+                    'NPCID': npc_id,
+                    'NPCType': npc.npc_type.value,
+                    'IsActive': npc.is_active,
+                }
+                cmd.update(_INACTIVE_UE5_COMMAND)
+                append(cmd)
+                continue
+            
+            active_count += 1
+            edge_preference = npc.edge_preference
+            activity_level = npc.activity_level
+            comfort_level = npc.comfort_level
+            append({
+                'NPCID': npc_id,
+                'NPCType': npc.npc_type.value,
+                'IsActive': npc.is_active,
+                'ComfortLevel': comfort_level.value,
+                'ComfortValue': npc.comfort_value,
+                'CurrentIdle': npc.current_idle.name if npc.current_idle else "STAND",
+                'IdleBehaviorsMask': npc.profile._idle_masks[_COMFORT_INDEX[comfort_level]],
+                'EdgePreference': edge_preference,
+                'InteractionRadius': npc.interaction_radius,
+                'WantsReposition': npc.wants_to_reposition,
+                'RepositionReason': npc.reposition_reason.value,
+                'RepositionTargetEdge': edge_preference > 0.5,
+                'ActivityLevel': activity_level,
+                'AnimationSpeed': 0.7 + activity_level * 0.3,
+            })
         
         return {
             'Population': manager.population,
             'GlobalComfort': manager.global_comfort.value,
-            'NPCCommands': [cmd.to_ue5_json() for cmd in commands],
+            'NPCCommands': npc_commands,
             'Summary': {
                 'TotalNPCs': len(manager.npcs),
-                'ActiveNPCs': sum(1 for n in manager.npcs.values() if n.is_active),
-                'RepositioningNPCs': sum(1 for n in manager.npcs.values() if n.wants_to_reposition),
+                'ActiveNPCs': active_count,
+                'RepositioningNPCs': repositioning_count,
             },
         }
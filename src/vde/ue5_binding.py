@@ -15,10 +15,10 @@ serialization for communication with UE5 via JSON or direct binding.
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Any, Tuple
 from enum import Enum
-import json
 import math
 
 from .vdi_calculator import VDIResult, VisualPhase, WildlifeState
+from ._common import ue5_json_string
 from .output_params import (
     VDEOutputState, PostProcessParams, MaterialParams,
     SpawnParams, ParticleParams, MotionParams, AttractionParams
@@ -316,7 +316,7 @@ class FVDERegionState:
     
     def to_json_string(self, indent: int = None) -> str:
         """Serialize to JSON string."""
-        return json.dumps(self.to_ue5_json(), indent=indent)
+        return ue5_json_string(self.to_ue5_json(), indent)
 
 
 # =============================================================================
@@ -638,7 +638,7 @@ class FVDEWorldState:
     
     def to_json_string(self, indent: int = None) -> str:
         """Serialize to JSON string."""
-        return json.dumps(self.to_ue5_json(), indent=indent)
+        return ue5_json_string(self.to_ue5_json(), indent)
 
 
 class MultiRegionProcessor:
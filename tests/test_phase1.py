@@ -19,8 +19,15 @@ src_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src')
 sys.path.insert(0, src_path)
 
 from utils import clamp, lerp, smoothstep, exp_smooth, SeededRNG
-from utils.math_utils import variance, coefficient_of_variation
+from utils.math_utils import (
+    variance, variance_stable, coefficient_of_variation, sdi_update, remap,
+    make_smoothstep, make_remap,
+)
 from utils.rng import RNGManager
+from utils.validators import (
+    ValidationError, validate_range, validate_range_array, validate_in_set,
+    validate_weather, validate_probability, validate_sdi, VALID_WEATHER,
+)
 from config import load_config, ConfigLoader
 from core.state import SimulationState, EnvironmentState, SDIState, SoundEvent, SoundMemory
 from core.clock import SimulationClock
@@ -48,14 +55,31 @@ def test_math_utils():
     assert 0.4 < smoothstep(0.0, 1.0, 0.5) < 0.6, "smoothstep middle failed"
     print("  ✓ smoothstep")
     
+    # Test specialized smoothstep / remap factories
+    band = make_smoothstep(0.2, 0.8)
+    for x in (0.0, 0.3, 0.5, 0.75, 1.0):
+        assert abs(band(x) - smoothstep(0.2, 0.8, x)) < 1e-12, "make_smoothstep mismatch"
+    to_db = make_remap(0.0, 1.0, -60.0, 0.0)
+    assert abs(to_db(0.25) - remap(0.25, 0.0, 1.0, -60.0, 0.0)) < 1e-12, "make_remap mismatch"
+    print("  ✓ make_smoothstep / make_remap")
+    
     # Test exp_smooth
     result = exp_smooth(0.0, 1.0, 0.2)
     assert result == 0.2, f"exp_smooth failed: {result}"
     print("  ✓ exp_smooth")
     
+    # Test fused SDI update matches the composed helpers
+    for cur, tgt in [(0.0, 1.0), (0.9, 3.0), (-0.5, -4.0)]:
+        fused = sdi_update(cur, tgt, 0.3, -1.0, 1.0)
+        composed = smoothstep(-1.0, 1.0, clamp(exp_smooth(cur, tgt, 0.3), -1.0, 1.0))
+        assert abs(fused - composed) < 1e-12, f"sdi_update mismatch: {fused} vs {composed}"
+    print("  ✓ sdi_update")
+    
     # Test variance
     v = variance([1, 2, 3, 4, 5])
     assert 1.9 < v < 2.1, f"variance failed: {v}"
+    samples = [0.3, 1.7, 2.2, 9.5, 4.1]
+    assert abs(variance(samples) - variance_stable(samples)) < 1e-9, "variance_stable mismatch"
     print("  ✓ variance")
     
     # Test coefficient of variation
@@ -95,18 +119,92 @@ def test_rng():
     rng = SeededRNG(seed=789)
     varied = rng.vary(10.0, 0.1)
     assert 9.0 <= varied <= 11.0, f"vary out of range: {varied}"
+    rng1, rng2 = SeededRNG(seed=789), SeededRNG(seed=789)
+    for value, ratio in [(10.0, 0.1), (7.7, 0.33), (0.3, 0.05)] * 20:
+        expected = rng2.uniform(value - value * ratio, value + value * ratio)
+        assert rng1.vary(value, ratio) == expected, "vary diverged from uniform"
     print("  ✓ vary")
     
+    # Test opt-in draw counting
+    rng = SeededRNG(seed=42)
+    rng.random()
+    assert rng.get_state()['call_count'] == 0, "counting should be off by default"
+    rng.enable_counting()
+    rng.random()
+    rng.uniform(0.0, 1.0)
+    assert rng.get_state()['call_count'] == 2, "counting not recorded"
+    rng.disable_counting()
+    rng.random()
+    assert rng.get_state()['call_count'] == 2, "counting not disabled"
+    print("  ✓ call counting")
+    
+    # Test batched gauss matches per-call gauss
+    rng1 = SeededRNG(seed=7)
+    rng2 = SeededRNG(seed=7)
+    batch = rng1.gauss_batch(5.0, 2.0, 8)
+    assert batch == [rng2.gauss(5.0, 2.0) for _ in range(8)], "gauss_batch mismatch"
+    print("  ✓ gauss_batch")
+    
     # Test RNG manager
     manager = RNGManager(master_seed=42)
     rng_a = manager.get('sounds')
     rng_b = manager.get('timing')
     assert rng_a.seed != rng_b.seed, "RNG streams should have different seeds"
+    assert manager.get('sounds') is rng_a, "RNGManager should reuse streams"
+    
+    # Derived stream seeds are part of recorded replays and must not change
+    manager = RNGManager(master_seed=42)
+    seeds = [manager.get(name).seed for name in ('a', 'b', 'c', 'd')]
+    assert seeds == [2746317213, 1181241943, 958682846, 3163119785], \
+        f"derived seeds changed: {seeds}"
     print("  ✓ RNGManager")
     
     print("  All RNG tests passed!")
 
 
+def test_validators():
+    """Test validation helpers."""
+    print("\n=== Testing Validators ===")
+    
+    values = [0.0, 0.5, 1.0]
+    assert validate_range_array(values, 0.0, 1.0) is values
+    try:
+        validate_range_array([0.1, 0.2, 1.5, -1.0], 0.0, 1.0, "weights")
+        assert False, "out-of-range value not rejected"
+    except ValidationError as e:
+        assert e.field == "weights[2]", f"wrong failure index: {e.field}"
+    print("  ✓ validate_range_array")
+    
+    try:
+        validate_weather('hail')
+        assert False, "invalid weather not rejected"
+    except ValidationError as e:
+        assert "[clear, cloudy, fog, rain, storm, wind]" in e.message, e.message
+    assert isinstance(VALID_WEATHER, frozenset), "cached value sets must be immutable"
+    try:
+        validate_in_set('c', {'b', 'a'})
+        assert False, "invalid value not rejected"
+    except ValidationError as e:
+        assert "[a, b]" in e.message, e.message
+    print("  ✓ validate_in_set")
+    
+    assert validate_probability(0.25) == 0.25
+    assert validate_sdi(-0.75) == -0.75
+    for fast, lo, hi, bad in [(validate_probability, 0.0, 1.0, 1.5),
+                              (validate_sdi, -1.0, 1.0, -2.0)]:
+        try:
+            fast(bad)
+            assert False, f"{fast.__name__} accepted {bad}"
+        except ValidationError as fast_err:
+            try:
+                validate_range(bad, lo, hi, fast_err.field)
+            except ValidationError as range_err:
+                assert str(fast_err) == str(range_err), str(fast_err)
+    print("  ✓ validate_probability / validate_sdi")
+    
+    print("  All validator tests passed!")
+
+
 def test_config_loading():
     """Test configuration loading."""
     print("\n=== Testing Config Loading ===")
@@ -356,6 +454,7 @@ def main():
     try:
         test_math_utils()
         test_rng()
+        test_validators()
         test_config_loading()
         test_state()
         test_clock()
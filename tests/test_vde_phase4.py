@@ -86,6 +86,22 @@ class TestComfortLevels(unittest.TestCase):
         high_comfort = self.manager.npcs["test_npc"].comfort_value
         
         self.assertGreater(low_comfort, high_comfort)
+    
+    def test_comfort_follows_crowd_sensitivity(self):
+        """NPCs with different sensitivities should get their own comfort levels."""
+        self.manager.register_npc("guard", NPCType.GUARD)
+        self.manager.register_npc("noble", NPCType.NOBLE)
+        self.manager.set_population(0.50)
+        self.manager.update(delta_time=0.5)
+        
+        # 0.50 * 0.6 = 0.30, 0.50 * 1.0 = 0.50, 0.50 * 1.5 = 0.75
+        npcs = self.manager.npcs
+        self.assertEqual(npcs["guard"].comfort_level, ComfortLevel.COMFORTABLE)
+        self.assertEqual(npcs["test_npc"].comfort_level, ComfortLevel.UNEASY)
+        self.assertEqual(npcs["noble"].comfort_level, ComfortLevel.STRESSED)
+        self.assertAlmostEqual(npcs["guard"].target_comfort, 0.75)
+        self.assertAlmostEqual(npcs["test_npc"].target_comfort, 0.5)
+        self.assertAlmostEqual(npcs["noble"].target_comfort, 0.25)
 
 
 class TestNPCTypes(unittest.TestCase):
@@ -184,6 +200,38 @@ class TestIdleBehaviors(unittest.TestCase):
         
         self.assertLess(bin(stressed_behaviors.value).count('1'),
                        bin(relaxed_behaviors.value).count('1'))
+    
+    def test_selected_behavior_within_mask(self):
+        """Selected behaviors should be single behaviors from the available mask."""
+        custom = IdleBehavior.SIT | IdleBehavior.READ | IdleBehavior.SMOKE
+        
+        for _ in range(20):
+            behavior = self.manager._select_random_behavior(custom)
+            self.assertIn(behavior, (IdleBehavior.SIT, IdleBehavior.READ,
+                                     IdleBehavior.SMOKE))
+        
+        self.assertEqual(self.manager._select_random_behavior(IdleBehavior.NONE),
+                         IdleBehavior.STAND)
+    
+    def test_custom_profile_idle_masks(self):
+        """Custom profiles should flatten idle behaviors, defaulting to STAND."""
+        profile = NPCBehaviorProfile(
+            npc_type=NPCType.AMBIENT,
+            idle_behaviors={ComfortLevel.RELAXED: IdleBehavior.SIT | IdleBehavior.READ},
+        )
+        self.manager.register_npc("reader", NPCType.AMBIENT, custom_profile=profile)
+        
+        self.manager.set_population(0.05)
+        for _ in range(30):
+            self.manager.update(delta_time=1.0)
+        npc = self.manager.npcs["reader"]
+        self.assertIn(npc.current_idle, (IdleBehavior.SIT, IdleBehavior.READ))
+        
+        self.manager.set_population(0.50)
+        self.manager.update(delta_time=0.5)
+        commands = {c['npc_id']: c for c in self.manager.get_behavior_commands()}
+        self.assertEqual(commands["reader"]['idle_behaviors_mask'],
+                         IdleBehavior.STAND.value)
 
 
 class TestRepositioning(unittest.TestCase):
@@ -489,6 +537,21 @@ class TestCommandGeneration(unittest.TestCase):
         self.assertIn('GlobalComfort', data)
         self.assertIn('NPCCommands', data)
         self.assertIn('Summary', data)
+    
+    def test_generator_ue5_json_matches_commands(self):
+        """UE5 JSON commands should match generate_commands, inactive NPCs included."""
+        self.manager.register_npc("noble", NPCType.NOBLE)
+        self.manager.set_population(0.90)
+        for _ in range(20):
+            self.manager.update(delta_time=0.5)
+        
+        data = self.generator.to_ue5_json(self.manager)
+        commands = self.generator.generate_commands(self.manager)
+        
+        self.assertEqual(data['NPCCommands'], [cmd.to_ue5_json() for cmd in commands])
+        self.assertFalse(self.manager.npcs["noble"].is_active)
+        self.assertEqual(data['Summary']['ActiveNPCs'],
+                         sum(1 for cmd in commands if cmd.is_active))
 
 
 class TestNPCConfig(unittest.TestCase):
@@ -515,6 +578,20 @@ class TestNPCConfig(unittest.TestCase):
             manager.update(delta_time=0.5)
         
         self.assertNotEqual(manager.global_comfort, ComfortLevel.RELAXED)
+    
+    def test_set_config(self):
+        """set_config should apply new comfort thresholds."""
+        manager = NPCManager()
+        manager.set_population(0.15)
+        manager.update(delta_time=0.5)
+        self.assertEqual(manager.global_comfort, ComfortLevel.RELAXED)
+        
+        config = NPCConfig()
+        config.relaxed_max_pop = 0.10
+        manager.set_config(config)
+        manager.update(delta_time=0.5)
+        
+        self.assertEqual(manager.global_comfort, ComfortLevel.COMFORTABLE)
 
 
 class TestNPCReset(unittest.TestCase):
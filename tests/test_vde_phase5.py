@@ -14,6 +14,8 @@ import sys
 import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
+import json
+import struct
 import unittest
 from vde.environmental_wear import (
     WearManager, WearConfig, WearSnapshot,
@@ -213,6 +215,22 @@ class TestSurfaceTypes(unittest.TestCase):
         self.assertGreater(snow.total_wear, grass.total_wear)
         self.assertGreater(grass.total_wear, stone.total_wear)
     
+    def test_surface_step_matches_reference_arithmetic(self):
+        """One step should equal rate * pop_factor * surface_mult * dt exactly."""
+        manager = WearManager(surface_type=SurfaceType.SNOW)
+        cfg = manager.config
+        manager.set_population(0.73)
+        manager.update(delta_time=0.37)
+        
+        pop_factor = (0.73 - cfg.wear_start_threshold) / (1.0 - cfg.wear_start_threshold)
+        surf_mult = cfg.surface_multipliers[SurfaceType.SNOW]
+        for layer in WearLayer:
+            expected = min(
+                cfg.max_wear[layer],
+                0.0 + cfg.accumulation_rates[layer] * pop_factor * surf_mult * 0.37,
+            )
+            self.assertEqual(manager.surface.layers[layer].value, expected)
+    
     def test_surface_wear_mapping(self):
         """Surface wear mapping should be correct."""
         grass_wear = SURFACE_WEAR_MAP[SurfaceType.GRASS]
@@ -289,6 +307,34 @@ class TestWearSnapshot(unittest.TestCase):
         
         self.assertFalse(snapshot.is_accumulating)
         self.assertTrue(snapshot.is_recovering)
+    
+    def test_reused_snapshot_buffer(self):
+        """With reuse enabled, one snapshot is refilled in place each tick."""
+        manager = WearManager(surface_type=SurfaceType.GRASS, reuse_snapshots=True)
+        manager.set_population(0.80)
+        self.manager.set_population(0.80)
+        
+        first = manager.update(delta_time=0.5)
+        kept = first.copy()
+        self.manager.update(delta_time=0.5)
+        second = manager.update(delta_time=0.5)
+        
+        self.assertIs(first, second)
+        self.assertGreater(second.total_wear, kept.total_wear)
+        self.assertIsNot(kept.layer_values, second.layer_values)
+        self.assertEqual(second.to_dict(), self.manager.update(delta_time=0.5).to_dict())
+    
+    def test_update_into_caller_buffer(self):
+        """update_into should fill and return the caller's snapshot."""
+        manager = WearManager(surface_type=SurfaceType.GRASS)
+        manager.set_population(0.80)
+        self.manager.set_population(0.80)
+        buffer = WearSnapshot()
+        
+        result = manager.update_into(0.5, buffer)
+        
+        self.assertIs(result, buffer)
+        self.assertEqual(buffer.to_dict(), self.manager.update(delta_time=0.5).to_dict())
 
 
 class TestUE5Parameters(unittest.TestCase):
@@ -333,6 +379,32 @@ class TestUE5Parameters(unittest.TestCase):
         self.assertIn('Grass_HeightMultiplier', data)
         self.assertEqual(data['Wear_DisplacementIntensity'], 0.5)
     
+    def test_parameters_to_bytes(self):
+        """Binary payload should pack the JSON values as float32 in key order."""
+        self.manager.set_population(0.80)
+        for _ in range(50):
+            self.manager.update(delta_time=0.5)
+        
+        params = self.manager.get_ue5_parameters()
+        payload = params.to_ue5_bytes()
+        data = params.to_ue5_json()
+        
+        self.assertEqual(len(payload), 4 * len(data))
+        for unpacked, expected in zip(struct.unpack('<%df' % len(data), payload), data.values()):
+            self.assertAlmostEqual(unpacked, expected, places=6)
+    
+    def test_ue5_values_follow_layer_changes(self):
+        """Memoized UE5 values should be rebuilt whenever wear changes."""
+        values = self.manager._get_ue5_values()
+        self.assertIs(self.manager._get_ue5_values(), values)
+        
+        self.manager.set_population(0.80)
+        self.manager.update(delta_time=0.5)
+        
+        params = self.manager.get_ue5_parameters()
+        self.assertEqual(self.manager._get_ue5_values(), tuple(params.to_ue5_json().values()))
+        self.assertNotEqual(self.manager._get_ue5_values(), values)
+    
     def test_footprint_parameters(self):
         """Should generate footprint decal parameters."""
         self.manager.set_population(0.80)
@@ -435,6 +507,33 @@ class TestRegionWearManager(unittest.TestCase):
         aggregate = self.region.get_aggregate_wear()
         self.assertGreater(aggregate, 0)
     
+    def test_reused_region_snapshots(self):
+        """With reuse enabled, update() refills one snapshot dict in place."""
+        region = RegionWearManager("reuse", reuse_snapshots=True)
+        region.add_zone("a", SurfaceType.GRASS)
+        region.add_zone("b", SurfaceType.DIRT, is_path=True)
+        region.set_population(0.60)
+        
+        first = region.update(delta_time=0.5)
+        first_a = first["a"]
+        second = region.update(delta_time=0.5)
+        
+        self.assertIs(first, second)
+        self.assertIs(second["a"], first_a)
+        self.assertEqual(list(second), ["a", "b"])
+    
+    def test_set_config_updates_all_zones(self):
+        """Region set_config should re-bake every zone from the new config."""
+        config = WearConfig(wear_start_threshold=0.10)
+        self.region.set_config(config)
+        
+        for zone in self.region.zones.values():
+            self.assertIs(zone.manager.config, config)
+        
+        self.region.set_population(0.15)
+        self.region.update(delta_time=10.0)
+        self.assertGreater(self.region.get_aggregate_wear(), 0)
+    
     def test_to_ue5_json(self):
         """Should generate complete UE5 JSON."""
         self.region.set_population(0.60)
@@ -447,6 +546,75 @@ class TestRegionWearManager(unittest.TestCase):
         self.assertIn('AggregateWear', data)
         self.assertIn('Zones', data)
         self.assertEqual(len(data['Zones']), 3)
+    
+    def test_to_json_string(self):
+        """JSON string should match the payload dict."""
+        self.region.set_population(0.60)
+        self.region.update(delta_time=0.5)
+        
+        data = json.loads(self.region.to_json_string())
+        
+        self.assertEqual(data, self.region.to_ue5_json())
+        self.assertAlmostEqual(data['AggregateWear'], self.region.get_aggregate_wear())
+        
+        self.assertEqual(self.region.to_json_string(), json.dumps(self.region.to_ue5_json()))
+        
+        # Zones added later are included
+        self.region.add_zone("fountain", SurfaceType.STONE, is_gathering_point=True)
+        self.assertEqual(self.region.to_json_string(), json.dumps(self.region.to_ue5_json()))
+    
+    def test_to_json_string_empty_region(self):
+        """An empty region should serialize with an empty zone map."""
+        region = RegionWearManager("empty")
+        
+        self.assertEqual(region.to_json_string(), json.dumps(region.to_ue5_json()))
+    
+    def test_live_zone_changes(self):
+        """Edits to zones after add_zone should apply on the next update."""
+        path = self.region.zones["grass_edge"]
+        reference = WearManager(surface_type=SurfaceType.GRASS)
+        reference.set_population(min(1.0, 0.5 * 1.3))
+        
+        path.is_path = True
+        del self.region.zones["center"]
+        self.region.set_population(0.5)
+        for _ in range(20):
+            snapshots = self.region.update(delta_time=0.5)
+            reference.update(delta_time=0.5)
+        
+        self.assertEqual(set(snapshots), {"grass_edge", "main_path"})
+        self.assertEqual(path.manager.total_wear, reference.total_wear)
+    
+    def test_zone_population_follows_traffic(self):
+        """Zone population should apply weight and traffic boosts from the live zone."""
+        self.region.set_population(0.5)
+        self.region.update(delta_time=0.5)
+        zones = self.region.zones
+        self.assertAlmostEqual(zones["center"].manager.population, 0.75)
+        self.assertAlmostEqual(zones["grass_edge"].manager.population, 0.5)
+        self.assertAlmostEqual(zones["main_path"].manager.population, 0.65)
+        
+        zones["grass_edge"].population_weight = 0.5
+        zones["main_path"].is_gathering_point = True
+        self.region.update(delta_time=0.5)
+        self.assertAlmostEqual(zones["grass_edge"].manager.population, 0.25)
+        self.assertAlmostEqual(zones["main_path"].manager.population, 0.975)
+    
+    def test_remove_zone(self):
+        """Removed zones should no longer be updated or reported."""
+        for reuse in (False, True):
+            region = RegionWearManager("marketplace", reuse_snapshots=reuse)
+            region.add_zone("a", SurfaceType.GRASS)
+            region.add_zone("b", SurfaceType.DIRT)
+            region.set_population(0.7)
+            region.update(delta_time=0.5)
+            
+            region.remove_zone("b")
+            region.remove_zone("missing")
+            snapshots = region.update(delta_time=0.5)
+            
+            self.assertEqual(list(snapshots), ["a"])
+            self.assertEqual(list(region.to_ue5_json()['Zones']), ["a"])
 
 
 class TestWearConfig(unittest.TestCase):
@@ -473,6 +641,50 @@ class TestWearConfig(unittest.TestCase):
         # Should accumulate wear
         self.assertGreater(manager.total_wear, 0)
     
+    def test_set_config(self):
+        """Config changes should apply after set_config."""
+        config = WearConfig()
+        manager = WearManager(surface_type=SurfaceType.GRASS, config=config)
+        manager.set_population(0.15)
+        
+        manager.update(delta_time=0.5)
+        self.assertEqual(manager.total_wear, 0.0)
+        
+        config.wear_start_threshold = 0.10
+        manager.set_config(config)
+        manager.update(delta_time=0.5)
+        self.assertGreater(manager.total_wear, 0)
+    
+    def test_same_config_shares_kernel(self):
+        """Managers with equal config values should share one wear kernel."""
+        a = WearManager(SurfaceType.DIRT, WearConfig())
+        b = WearManager(SurfaceType.DIRT, WearConfig())
+        c = WearManager(SurfaceType.GRASS, WearConfig())
+        
+        self.assertIs(a._step_layers, b._step_layers)
+        self.assertIsNot(a._step_layers, c._step_layers)
+        
+        b.set_config(WearConfig(wear_start_threshold=0.5))
+        self.assertIsNot(a._step_layers, b._step_layers)
+    
+    def test_layer_diagnostics_opt_in(self):
+        """Layer timing should only be tracked with diagnostics enabled."""
+        config = WearConfig(enable_diagnostics=True)
+        tracked = WearManager(surface_type=SurfaceType.GRASS, config=config)
+        untracked = WearManager(surface_type=SurfaceType.GRASS)
+        
+        for manager in (tracked, untracked):
+            manager.set_population(0.50)
+            for _ in range(4):
+                manager.update(delta_time=0.5)
+        
+        layer = WearLayer.DISPLACEMENT
+        self.assertAlmostEqual(tracked.surface.layers[layer].time_at_current, 2.0)
+        self.assertEqual(untracked.surface.layers[layer].time_at_current, 0.0)
+        self.assertEqual(
+            tracked.surface.layers[layer].value, untracked.surface.layers[layer].value
+        )
+    
     def test_accumulation_rates(self):
         """Accumulation rates should be correctly ordered."""
         config = WearConfig()
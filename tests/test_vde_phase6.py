@@ -15,6 +15,7 @@ import sys
 import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
+import json
 import unittest
 import math
 from vde.motion_coherence import (
@@ -389,6 +390,32 @@ class TestMotionSnapshot(unittest.TestCase):
         self.assertIn('coherence_value', data)
         self.assertIn('global_wind_direction', data)
         self.assertIn('categories', data)
+    
+    def test_reused_snapshot_buffer(self):
+        """With reuse enabled, one snapshot is refilled in place each tick."""
+        reused = MotionManager(reuse_snapshots=True)
+        fresh = MotionManager()
+        for manager in (reused, fresh):
+            manager.register_element("tree_01", MotionCategory.FOLIAGE)
+            manager.register_element("cloth_01", MotionCategory.CLOTH)
+        
+        snapshots = []
+        for population in (0.05, 0.05, 0.90, 0.90, 0.40):
+            reused.set_population(population)
+            fresh.set_population(population)
+            reused_snapshot = reused.update(delta_time=0.5)
+            fresh_snapshot = fresh.update(delta_time=0.5)
+            
+            self.assertEqual(reused_snapshot.to_dict(), fresh_snapshot.to_dict())
+            snapshots.append((reused_snapshot, reused_snapshot.copy(), fresh_snapshot))
+        
+        first, kept, _ = snapshots[0]
+        second = snapshots[-1][0]
+        self.assertIs(first, second)
+        self.assertEqual(kept.to_dict(), snapshots[0][2].to_dict())
+        self.assertNotEqual(kept.to_dict(), second.to_dict())
+        # The buffer returned on the first tick now holds the latest state
+        self.assertEqual(first.to_dict(), snapshots[-1][2].to_dict())
 
 
 class TestUE5Parameters(unittest.TestCase):
@@ -439,6 +466,15 @@ class TestUE5Parameters(unittest.TestCase):
         self.assertIn('Cloth_SettlingRate', data)
         self.assertIn('Prop_JitterAmount', data)
     
+    def test_parameters_to_json_string(self):
+        """JSON string should match the UE5 payload dict."""
+        self.manager.set_population(0.70)
+        self.manager.update(delta_time=0.5)
+        params = self.manager.get_ue5_parameters()
+        
+        self.assertEqual(params.to_json_string(), json.dumps(params.to_ue5_json()))
+        self.assertEqual(json.loads(params.to_json_string(indent=2)), params.to_ue5_json())
+    
     def test_npc_breathing_sync(self):
         """NPC breathing sync should vary with coherence."""
         # UNIFIED - almost too perfect
@@ -536,6 +572,20 @@ class TestMotionConfig(unittest.TestCase):
             manager.update(delta_time=0.5)
         
         self.assertNotEqual(manager.coherence_level, CoherenceLevel.UNIFIED)
+    
+    def test_set_config(self):
+        """set_config should re-derive the per-level variance table."""
+        manager = MotionManager()
+        manager.set_population(0.85)
+        manager.update(delta_time=0.5)
+        
+        config = MotionConfig()
+        config.direction_variance[CoherenceLevel.CHAOTIC] = 90.0
+        manager.set_config(config)
+        
+        params = manager.get_ue5_parameters()
+        self.assertEqual(params.wind_direction_variance, 90.0)
+        self.assertEqual(params.particle_direction_variance, 90.0)
 
 
 class TestMotionReset(unittest.TestCase):
@@ -14,6 +14,7 @@ import sys
 import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
+import json
 import unittest
 from vde.attraction_system import (
     AttractionManager, AttractionConfig, AttractionSnapshot,
@@ -74,6 +75,26 @@ class TestAttractionStrength(unittest.TestCase):
         
         self.assertEqual(self.manager.attraction_strength, AttractionStrength.NONE)
     
+    def test_threshold_boundaries(self):
+        """Populations exactly at a threshold fall into the weaker bucket."""
+        cfg = self.manager.config
+        expected = [
+            (0.0, AttractionStrength.BEACON),
+            (cfg.beacon_max_pop, AttractionStrength.STRONG),
+            (cfg.strong_max_pop, AttractionStrength.MODERATE),
+            (cfg.moderate_max_pop, AttractionStrength.SUBTLE),
+            (cfg.subtle_max_pop, AttractionStrength.NONE),
+            (1.0, AttractionStrength.NONE),
+        ]
+        for population, strength in expected:
+            self.manager.set_population(population)
+            self.manager.update(delta_time=0.5)
+            self.assertEqual(self.manager.attraction_strength, strength)
+            self.assertEqual(
+                self.manager.state.strength_index,
+                AttractionManager.STRENGTH_ORDER.index(strength),
+            )
+    
     def test_attraction_value_inversely_correlates(self):
         """Attraction value should be higher for lower population."""
         self.manager.set_population(0.05)
@@ -326,6 +347,52 @@ class TestAttractionCoordinator(unittest.TestCase):
         
         self.assertEqual(most_attractive, "quiet_grove")
     
+    def test_most_attractive_tracks_region_changes(self):
+        """Cached most-attractive region should follow added/removed regions."""
+        self.coordinator.set_population("marketplace", 0.90)
+        self.coordinator.set_population("forest_path", 0.30)
+        self.coordinator.set_population("quiet_grove", 0.05)
+        
+        for _ in range(30):
+            self.coordinator.update(delta_time=0.5)
+        
+        self.assertEqual(self.coordinator.get_most_attractive_region(), "quiet_grove")
+        
+        self.coordinator.remove_region("quiet_grove")
+        self.assertEqual(self.coordinator.get_most_attractive_region(), "forest_path")
+    
+    def test_many_crowded_regions_pressure(self):
+        """Grid-culled pressure for large worlds should match brute force."""
+        import math
+        import random
+        
+        rng = random.Random(7)
+        coordinator = AttractionCoordinator()
+        layout = {}
+        for i in range(80):
+            region_id = f"r{i}"
+            position = (rng.uniform(0, 4000), rng.uniform(0, 4000))
+            layout[region_id] = (position, rng.uniform(0.4, 1.0))
+            coordinator.add_region(region_id, position=position)
+            coordinator.set_population(region_id, layout[region_id][1])
+        
+        coordinator.update(delta_time=0.5)
+        
+        cfg = coordinator.config
+        radius = cfg.neighbor_influence_radius
+        for target_id, ((tx, ty), _) in layout.items():
+            total, count = 0.0, 0
+            for source_id, ((sx, sy), pop) in layout.items():
+                distance = math.hypot(tx - sx, ty - sy)
+                if source_id == target_id or pop <= 0.5 or distance > radius:
+                    continue
+                total += pop * (1.0 - distance / radius) * cfg.neighbor_influence_falloff
+                count += 1
+            expected = total / count if count else 0.0
+            self.assertAlmostEqual(
+                coordinator.regions[target_id].state.neighbor_pressure, expected
+            )
+    
     def test_pressure_map(self):
         """Should generate pressure map."""
         self.coordinator.set_population("marketplace", 0.80)
@@ -369,6 +436,46 @@ class TestAttractionSnapshot(unittest.TestCase):
         self.assertIsInstance(snapshot.signal_boosts, dict)
         self.assertIsInstance(snapshot.active_cues, list)
     
+    def test_settled_snapshot_reused(self):
+        """Settled state with unchanged inputs should serve copies of one snapshot."""
+        self.manager.set_population(0.05)
+        for _ in range(300):
+            snapshot = self.manager.update(delta_time=0.5)
+        
+        again = self.manager.update(delta_time=0.5)
+        self.assertIsNot(again, snapshot)
+        self.assertEqual(again.to_dict(), snapshot.to_dict())
+        self.assertEqual(snapshot.attraction_value, 1.0)
+        
+        # Editing a returned snapshot must not leak into later ones
+        again.signal_boosts[AttractionSignal.LIGHT_QUALITY] = -1.0
+        later = self.manager.update(delta_time=0.5)
+        self.assertEqual(later.to_dict(), snapshot.to_dict())
+        
+        # Changing an input invalidates the cached snapshot
+        self.manager.set_population(0.80)
+        changed = self.manager.update(delta_time=0.5)
+        self.assertIsNot(changed, snapshot)
+        self.assertEqual(changed.attraction_strength, AttractionStrength.NONE)
+    
+    def test_reused_snapshot_buffer(self):
+        """With reuse enabled, one snapshot is refilled in place each tick."""
+        manager = AttractionManager("test_region", reuse_snapshots=True)
+        manager.set_population(0.05)
+        first = manager.update(delta_time=0.5)
+        kept = first.copy()
+        second = manager.update(delta_time=0.5)
+        
+        self.assertIs(first, second)
+        self.assertGreater(second.attraction_value, kept.attraction_value)
+        self.assertIsNot(kept.signal_boosts, second.signal_boosts)
+        
+        # Once settled, the reused buffer is still the object returned
+        for _ in range(300):
+            settled = manager.update(delta_time=0.5)
+        self.assertIs(manager.update(delta_time=0.5), settled)
+        self.assertIs(settled, first)
+    
     def test_snapshot_to_dict(self):
         """Snapshot should serialize to dictionary."""
         self.manager.set_population(0.20)
@@ -429,6 +536,28 @@ class TestUE5Parameters(unittest.TestCase):
         self.assertIn('Cue_LightShafts', data)
         self.assertIn('CrossRegion_NeighborPressure', data)
     
+    def test_parameters_to_json_string(self):
+        """JSON string should round-trip to the dict export."""
+        params = FAttractionParameters()
+        params.attraction_strength = "strong"
+        params.light_quality_boost = 0.15
+        params.is_overflow_target = True
+        
+        self.assertEqual(json.loads(params.to_json_string()), params.to_ue5_json())
+        self.assertEqual(json.loads(params.to_json_string(indent=2)), params.to_ue5_json())
+    
+    def test_parameters_json_string_matches_dumps(self):
+        """Output should match json.dumps with default separators."""
+        for params in (
+            FAttractionParameters(),
+            FAttractionParameters(attraction_strength='say "hi"', attraction_value=1e-20),
+            FAttractionParameters(light_quality_boost=2, neighbor_pressure=-0.0),
+            FAttractionParameters(attraction_value=float('nan')),
+            FAttractionParameters(attraction_value=True),
+        ):
+            expected = json.dumps(params.to_ue5_json())
+            self.assertEqual(params.to_json_string(), expected)
+    
     def test_coordinator_to_ue5_json(self):
         """Coordinator should generate complete UE5 JSON."""
         coordinator = AttractionCoordinator()
@@ -467,6 +596,27 @@ class TestDistantCueGenerator(unittest.TestCase):
         
         self.assertGreater(len(commands), 0)
     
+    def test_spawn_cues_follow_active_cues(self):
+        """spawn_cues should hold the active cues strong enough to spawn."""
+        self.manager.set_population(0.05)
+        
+        for _ in range(30):
+            self.manager.update(delta_time=0.5)
+        
+        state = self.manager.state
+        expected = {
+            cue for cue in state.active_cues if state.cue_intensities[cue] >= 0.1
+        }
+        self.assertEqual({cue for cue, _ in state.spawn_cues}, expected)
+        self.assertEqual(
+            [cmd.cue_type for cmd in self.generator.generate_cues(self.manager)],
+            [cue for cue, _ in state.spawn_cues],
+        )
+        
+        self.manager.reset()
+        self.assertEqual(self.manager.state.spawn_cues, ())
+        self.assertEqual(self.generator.generate_cues(self.manager), [])
+    
     def test_cue_command_structure(self):
         """Cue commands should have correct structure."""
         self.manager.set_population(0.05)
@@ -498,6 +648,27 @@ class TestDistantCueGenerator(unittest.TestCase):
         self.assertIn('Intensity', data)
         self.assertIn('Position', data)
         self.assertIn('Scale', data)
+        self.assertEqual(json.loads(cmd.to_json_string()), data)
+    
+    def test_encode_all_cues(self):
+        """All regions' cues should encode to a single JSON document."""
+        coordinator = AttractionCoordinator()
+        coordinator.add_region("quiet", position=(0, 0))
+        coordinator.add_region("busy", position=(500, 0))
+        coordinator.set_population("quiet", 0.05)
+        coordinator.set_population("busy", 0.90)
+        
+        for _ in range(30):
+            coordinator.update(delta_time=0.5)
+        
+        cues = self.generator.generate_all_cues(coordinator)
+        data = json.loads(DistantCueGenerator.encode_all(cues))
+        
+        self.assertEqual(set(data), {"quiet", "busy"})
+        self.assertGreater(len(data["quiet"]), 0)
+        self.assertEqual(
+            data["quiet"], [cmd.to_ue5_json() for cmd in cues["quiet"]]
+        )
 
 
 class TestAttractionConfig(unittest.TestCase):
@@ -523,6 +694,60 @@ class TestAttractionConfig(unittest.TestCase):
             manager.update(delta_time=0.5)
         
         self.assertEqual(manager.attraction_strength, AttractionStrength.BEACON)
+    
+    def test_set_config_after_construction(self):
+        """Threshold changes should apply once set_config is called."""
+        config = AttractionConfig()
+        manager = AttractionManager("test", config=config)
+        manager.set_population(0.15)
+        for _ in range(30):
+            manager.update(delta_time=0.5)
+        self.assertEqual(manager.attraction_strength, AttractionStrength.STRONG)
+        
+        config.beacon_max_pop = 0.20
+        manager.set_config(config)
+        manager.update(delta_time=0.5)
+        
+        self.assertEqual(manager.attraction_strength, AttractionStrength.BEACON)
+    
+    def test_set_config_rebuilds_signal_and_cue_tables(self):
+        """Signal boost and cue threshold edits should apply on set_config."""
+        config = AttractionConfig()
+        manager = AttractionManager("test", config=config)
+        manager.set_population(0.05)
+        for _ in range(60):
+            manager.update(delta_time=0.5)
+        self.assertIn(DistantCue.CLEAR_SKY, manager.state.active_cues)
+        
+        config.signal_boosts[AttractionStrength.BEACON][AttractionSignal.LIGHT_QUALITY] = 0.5
+        del config.distant_cue_thresholds[DistantCue.CLEAR_SKY]
+        config.distant_cue_thresholds[DistantCue.LIGHT_SHAFTS] = AttractionStrength.BEACON
+        manager.set_config(config)
+        for _ in range(200):
+            manager.update(delta_time=0.5)
+        
+        state = manager.state
+        self.assertAlmostEqual(state.signal_boosts[AttractionSignal.LIGHT_QUALITY], 0.5,
+                               places=3)
+        self.assertNotIn(DistantCue.CLEAR_SKY, state.active_cues)
+        self.assertAlmostEqual(state.cue_intensities[DistantCue.LIGHT_SHAFTS], 0.2)
+    
+    def test_coordinator_set_config(self):
+        """Coordinator set_config should reach every region."""
+        coordinator = AttractionCoordinator()
+        coordinator.add_region("a", position=(0, 0))
+        coordinator.add_region("b", position=(5000, 0))
+        coordinator.set_population("a", 0.15)
+        coordinator.set_population("b", 0.15)
+        coordinator.update(delta_time=0.5)
+        
+        config = AttractionConfig(beacon_max_pop=0.20)
+        coordinator.set_config(config)
+        coordinator.update(delta_time=0.5)
+        
+        for manager in coordinator.regions.values():
+            self.assertIs(manager.config, config)
+            self.assertEqual(manager.attraction_strength, AttractionStrength.BEACON)
 
 
 class TestAttractionReset(unittest.TestCase):
@@ -559,6 +784,41 @@ class TestAttractionReset(unittest.TestCase):
 class TestIntegration(unittest.TestCase):
     """Integration tests for attraction system."""
     
+    def test_ue5_json_cache_follows_changes(self):
+        """Cached region payloads should match freshly built parameters."""
+        coordinator = AttractionCoordinator()
+        coordinator.add_region("a", position=(0, 0))
+        coordinator.add_region("b", position=(400, 0))
+        coordinator.set_population("a", 0.90)
+        coordinator.set_population("b", 0.05)
+        
+        for step in range(200):
+            if step == 120:
+                coordinator.set_population("b", 0.70)
+            coordinator.update(delta_time=0.5)
+            payload = coordinator.to_ue5_json()
+            for region_id, manager in coordinator.regions.items():
+                self.assertEqual(
+                    payload['Regions'][region_id],
+                    manager.get_ue5_parameters().to_ue5_json(),
+                )
+    
+    def test_ue5_json_payload_edits_do_not_leak(self):
+        """Editing a returned region dict should not affect the next payload."""
+        coordinator = AttractionCoordinator()
+        coordinator.add_region("a", position=(0, 0))
+        coordinator.set_population("a", 0.05)
+        for _ in range(300):
+            coordinator.update(delta_time=0.5)
+        
+        first = coordinator.to_ue5_json()
+        expected = dict(first['Regions']['a'])
+        first['Regions']['a']['Attraction_Value'] = -1.0
+        first['Regions']['a']['Annotation'] = 'edited'
+        
+        second = coordinator.to_ue5_json()
+        self.assertEqual(second['Regions']['a'], expected)
+    
     def test_full_cross_region_cycle(self):
         """Test complete cross-region attraction cycle."""
         coordinator = AttractionCoordinator()